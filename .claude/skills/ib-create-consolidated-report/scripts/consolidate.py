@@ -7,7 +7,9 @@ import asyncio
 import csv
 import json
 import sys
+from collections import Counter
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
@@ -16,91 +18,117 @@ from trading_skills.broker.consolidate import (
     AGG_COLS,
     GROUP_COLS,
     KEEP_COLS,
-    consolidate_rows,
+    consolidate_frame,
     fetch_unrealized_pnl,
-    read_csv_files,
+    read_csv_frame,
 )
 from trading_skills.utils import format_expiry_iso, generated_at_str
 
 _NY = ZoneInfo("America/New_York")
 
 
-def format_money(value: float, bold: bool = False) -> str:
-    """Format money value, with red color for negative numbers."""
-    formatted = f"${value:,.2f}"
-    if bold:
-        formatted = f"**{formatted}**"
-    if value < 0:
-        return f'<span style="color:red">{formatted}</span>'
-    return formatted
+# format_money templates keyed by (negative, bold)
+_MONEY_TEMPLATES = {
+    (False, False): "${:,.2f}",
+    (False, True): "**${:,.2f}**",
+    (True, False): '<span style="color:red">${:,.2f}</span>',
+    (True, True): '<span style="color:red">**${:,.2f}**</span>',
+}
 
 
-def generate_markdown(
+def format_money(value: float, bold: bool = False) -> str:
+    """Format money value, with red color for negative numbers."""
+    return _MONEY_TEMPLATES[value < 0, bool(bold)].format(value)
+
+
+def _underlying_stats(rows: list[dict]) -> dict:
+    """Per-underlying totals and position counts, gathered in one pass over rows.
+
+    Values are collected into lists and summed afterwards so totals keep sum()'s
+    float accuracy; both report sections read from the result.
+    """
+    net_cash, pnl, commission, qty, long_pnl, short_pnl = [], [], [], [], [], []
+    positions = Counter()
+    for r in rows:
+        get = r.get
+        position = get("Position")
+        positions[position] += 1
+        row_pnl = get("FifoPnlRealized", 0)
+        net_cash.append(get("NetCash", 0))
+        pnl.append(row_pnl)
+        commission.append(get("IBCommission", 0))
+        qty.append(get("Quantity", 0))
+        if position == "CLOSE_LONG":
+            long_pnl.append(row_pnl)
+        elif position == "CLOSE_SHORT":
+            short_pnl.append(row_pnl)
+    return {
+        "net_cash": sum(net_cash),
+        "pnl": sum(pnl),
+        "commission": sum(commission),
+        "total_qty": sum(qty),
+        "long_pnl": sum(long_pnl),
+        "short_pnl": sum(short_pnl),
+        "positions": positions,
+    }
+
+
+def _markdown_lines(
     consolidated: list[dict],
     unrealized_pnl: dict[str, float],
     processed_files: list[Path],
-    output_path: Path,
 ):
-    """Generate markdown report."""
+    """Yield the markdown report one line at a time.
+
+    consolidated must be in consolidate_frame order (underlying, date, symbol).
+    """
     has_unrealized = bool(unrealized_pnl)
+    # One clock reading, so header and footer always agree
+    now = datetime.now(_NY)
 
-    lines = [
+    yield from [
         "# Consolidated Trades Report",
-        f"**Generated:** {datetime.now(_NY).strftime('%B %d, %Y at %H:%M ET')}",
+        f"**Generated:** {now.strftime('%B %d, %Y at %H:%M ET')}",
         "",
         f"**Total Consolidated Rows:** {len(consolidated)}",
     ]
 
     if has_unrealized:
-        lines.append("**Portfolio Data:** Connected to IB")
+        yield "**Portfolio Data:** Connected to IB"
     else:
-        lines.append("**Portfolio Data:** Not available (no IB connection)")
+        yield "**Portfolio Data:** Not available (no IB connection)"
 
-    lines.append("")
-    lines.append(f"**Processed Files ({len(processed_files)}):**")
+    yield ""
+    yield f"**Processed Files ({len(processed_files)}):**"
     for f in processed_files:
-        lines.append(f"- `{f}`")
+        yield f"- `{f}`"
 
-    lines.extend(["", "---", ""])
+    yield from ["", "---", ""]
 
-    # Group by underlying for summary
+    # Group by underlying; each group's totals are computed once for both sections
     by_underlying = {}
     for row in consolidated:
-        underlying = row.get("UnderlyingSymbol", "UNKNOWN")
-        if underlying not in by_underlying:
-            by_underlying[underlying] = []
-        by_underlying[underlying].append(row)
+        by_underlying.setdefault(row.get("UnderlyingSymbol", "UNKNOWN"), []).append(row)
+    stats = {underlying: _underlying_stats(rows) for underlying, rows in by_underlying.items()}
 
     # Summary table
     summary_data = []
-    for underlying in by_underlying.keys():
-        rows = by_underlying[underlying]
-        net_cash = sum(r.get("NetCash", 0) for r in rows)
-        pnl = sum(r.get("FifoPnlRealized", 0) for r in rows)
-        commission = sum(r.get("IBCommission", 0) for r in rows)
-        total_realized = pnl + commission
+    for underlying, rows in by_underlying.items():
+        st = stats[underlying]
+        total_realized = st["pnl"] + st["commission"]
         unrealized = unrealized_pnl.get(underlying, 0)
         total_pnl = total_realized + unrealized
 
-        total_qty = sum(r.get("Quantity", 0) for r in rows)
-
-        long_pnl = sum(
-            r.get("FifoPnlRealized", 0) for r in rows if r.get("Position") == "CLOSE_LONG"
-        )
-        short_pnl = sum(
-            r.get("FifoPnlRealized", 0) for r in rows if r.get("Position") == "CLOSE_SHORT"
-        )
-
         summary_data.append(
             {
                 "underlying": underlying,
                 "trades": len(rows),
-                "total_qty": total_qty,
-                "net_cash": net_cash,
-                "pnl": pnl,
-                "long_pnl": long_pnl,
-                "short_pnl": short_pnl,
-                "commission": commission,
+                "total_qty": st["total_qty"],
+                "net_cash": st["net_cash"],
+                "pnl": st["pnl"],
+                "long_pnl": st["long_pnl"],
+                "short_pnl": st["short_pnl"],
+                "commission": st["commission"],
                 "total_realized": total_realized,
                 "unrealized": unrealized,
                 "total_pnl": total_pnl,
@@ -109,8 +137,8 @@ def generate_markdown(
 
     summary_data.sort(key=lambda x: x["total_pnl"], reverse=True)
 
-    lines.append("## Summary by Underlying")
-    lines.append("")
+    yield "## Summary by Underlying"
+    yield ""
 
     hdr_base = (
         "| Underlying | Trades | Total Qty"
@@ -123,11 +151,11 @@ def generate_markdown(
         "------------|-------------------"
     )
     if has_unrealized:
-        lines.append(hdr_base + " | Unrealized P&L | Total P&L |")
-        lines.append(sep_base + "|----------------|-----------|")
+        yield hdr_base + " | Unrealized P&L | Total P&L |"
+        yield sep_base + "|----------------|-----------|"
     else:
-        lines.append(hdr_base + " |")
-        lines.append(sep_base + "|")
+        yield hdr_base + " |"
+        yield sep_base + "|"
 
     grand_total_pnl = 0
     grand_total_long_pnl = 0
@@ -156,10 +184,10 @@ def generate_markdown(
             real_m = format_money(row["total_realized"])
             unrl_m = format_money(row["unrealized"])
             total_m = format_money(row["total_pnl"], bold=True)
-            lines.append(f"{prefix} | {real_m} | {unrl_m} | {total_m} |")
+            yield f"{prefix} | {real_m} | {unrl_m} | {total_m} |"
         else:
             real_m = format_money(row["total_realized"], bold=True)
-            lines.append(f"{prefix} | {real_m} |")
+            yield f"{prefix} | {real_m} |"
 
     grand_total_realized = grand_total_pnl + grand_total_commission
     grand_total = grand_total_realized + grand_total_unrealized
@@ -176,78 +204,86 @@ def generate_markdown(
     if has_unrealized:
         gt_unrl = format_money(grand_total_unrealized, bold=True)
         gt_total = format_money(grand_total, bold=True)
-        lines.append(f"{gt_prefix} | {gt_real} | {gt_unrl} | {gt_total} |")
+        yield f"{gt_prefix} | {gt_real} | {gt_unrl} | {gt_total} |"
     else:
-        lines.append(f"{gt_prefix} | {gt_real} |")
+        yield f"{gt_prefix} | {gt_real} |"
 
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    yield ""
+    yield "---"
+    yield ""
 
     # Detail by underlying
-    lines.append("## Detail by Underlying")
-    lines.append("")
+    yield "## Detail by Underlying"
+    yield ""
 
     for underlying in sorted(by_underlying.keys()):
         rows = by_underlying[underlying]
-        lines.append(f"### {underlying}")
-        lines.append("")
-
-        long_pnl = sum(
-            r.get("FifoPnlRealized", 0) for r in rows if r.get("Position") == "CLOSE_LONG"
-        )
-        short_pnl = sum(
-            r.get("FifoPnlRealized", 0) for r in rows if r.get("Position") == "CLOSE_SHORT"
-        )
-        total_symbol_pnl = sum(r.get("FifoPnlRealized", 0) for r in rows)
-
-        long_opens = len([r for r in rows if r.get("Position") == "LONG"])
-        long_closes = len([r for r in rows if r.get("Position") == "CLOSE_LONG"])
-        short_opens = len([r for r in rows if r.get("Position") == "SHORT"])
-        short_closes = len([r for r in rows if r.get("Position") == "CLOSE_SHORT"])
-
-        lines.append("#### P&L Summary")
-        lines.append("")
-        lines.append("| Position Type | Trades | Realized P&L |")
-        lines.append("|---------------|--------|--------------|")
-        lines.append(
-            f"| Long (open/close) | {long_opens}/{long_closes} | {format_money(long_pnl)} |"
-        )
-        lines.append(
-            f"| Short (open/close) | {short_opens}/{short_closes} | {format_money(short_pnl)} |"
-        )
-        lines.append(f"| **Total** | {len(rows)} | {format_money(total_symbol_pnl, bold=True)} |")
-        lines.append("")
-
-        lines.append("#### Trades (by Date)")
-        lines.append("")
-        lines.append("| Date | Strike | Type | Position | Qty | Net Cash | P&L |")
-        lines.append("|------|--------|------|----------|-----|----------|-----|")
-
-        sorted_rows = sorted(rows, key=lambda x: (x.get("TradeDate", ""), x.get("Symbol", "")))
-
-        for row in sorted_rows:
-            trade_date = format_expiry_iso(row.get("TradeDate", ""))
-            strike = row.get("Strike", "")
-            put_call = row.get("Put/Call", "")
-            position = row.get("Position", "")
-            qty = row.get("Quantity", 0)
-            net_cash = row.get("NetCash", 0)
-            pnl = row.get("FifoPnlRealized", 0)
-
-            lines.append(
+        yield f"### {underlying}"
+        yield ""
+
+        st = stats[underlying]
+        long_pnl = st["long_pnl"]
+        short_pnl = st["short_pnl"]
+        total_symbol_pnl = st["pnl"]
+
+        positions = st["positions"]
+        long_opens = positions["LONG"]
+        long_closes = positions["CLOSE_LONG"]
+        short_opens = positions["SHORT"]
+        short_closes = positions["CLOSE_SHORT"]
+
+        yield "#### P&L Summary"
+        yield ""
+        yield "| Position Type | Trades | Realized P&L |"
+        yield "|---------------|--------|--------------|"
+        yield f"| Long (open/close) | {long_opens}/{long_closes} | {format_money(long_pnl)} |"
+        yield f"| Short (open/close) | {short_opens}/{short_closes} | {format_money(short_pnl)} |"
+        yield f"| **Total** | {len(rows)} | {format_money(total_symbol_pnl, bold=True)} |"
+        yield ""
+
+        yield "#### Trades (by Date)"
+        yield ""
+        yield "| Date | Strike | Type | Position | Qty | Net Cash | P&L |"
+        yield "|------|--------|------|----------|-----|----------|-----|"
+
+        # consolidate_frame sorts by underlying, date, symbol, so each group's rows
+        # are already in date order
+        for row in rows:
+            get = row.get
+            trade_date = format_expiry_iso(get("TradeDate", ""))
+            strike = get("Strike", "")
+            put_call = get("Put/Call", "")
+            position = get("Position", "")
+            qty = get("Quantity", 0)
+            net_cash = get("NetCash", 0)
+            pnl = get("FifoPnlRealized", 0)
+
+            yield (
                 f"| {trade_date} | {strike} | {put_call} | {position} | "
                 f"{qty:,.0f} | {format_money(net_cash)} | {format_money(pnl)} |"
             )
 
-        lines.append("")
+        yield ""
+
+    yield "---"
+    yield ""
+    yield f"*Report generated on {now.strftime('%Y-%m-%d %H:%M ET')}*"
 
-    lines.append("---")
-    lines.append("")
-    lines.append(f"*Report generated on {datetime.now(_NY).strftime('%Y-%m-%d %H:%M ET')}*")
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+def generate_markdown(
+    consolidated: list[dict],
+    unrealized_pnl: dict[str, float],
+    processed_files: list[Path],
+    output_path: Path,
+):
+    """Generate markdown report, streaming lines to disk instead of joining them first."""
+    lines = _markdown_lines(consolidated, unrealized_pnl, processed_files)
+    with open(output_path, "w", encoding="utf-8", buffering=65536) as f:
+        write = f.write
+        write(next(lines))
+        for line in lines:
+            write("\n")
+            write(line)
 
     print(f"Markdown report saved to: {output_path}")
 
@@ -258,12 +294,14 @@ def generate_csv(consolidated: list[dict], output_path: Path):
         print("No data to write to CSV")
         return
 
-    columns = KEEP_COLS + GROUP_COLS + ["Position"] + AGG_COLS
+    columns = [*KEEP_COLS, *GROUP_COLS, "Position", *AGG_COLS]
 
+    # Every consolidated row carries all columns, so rows are pulled out as tuples in C
+    # instead of DictWriter's per-field get() generator.
     with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
-        writer.writeheader()
-        writer.writerows(consolidated)
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(map(itemgetter(*columns), consolidated))
 
     print(f"CSV report saved to: {output_path}")
 
@@ -288,16 +326,16 @@ async def main_async(args):
 
     # Read and consolidate
     print(f"\nReading CSV files from: {input_dir}")
-    rows, processed_files = read_csv_files(input_dir)
+    trades, processed_files = read_csv_frame(input_dir)
 
-    if not rows:
+    if trades is None or trades.empty:
         print("No data found to consolidate")
         sys.exit(1)
 
-    print(f"\nTotal rows read: {len(rows)}")
+    print(f"\nTotal rows read: {len(trades)}")
     print("Consolidating...")
 
-    consolidated = consolidate_rows(rows)
+    consolidated = consolidate_frame(trades)
     print(f"Consolidated to {len(consolidated)} grouped rows")
 
     # Fetch unrealized P&L from IB (auto-probe ports if not specified)
@@ -320,7 +358,7 @@ async def main_async(args):
             {
                 "success": True,
                 "input_directory": str(input_dir),
-                "rows_read": len(rows),
+                "rows_read": len(trades),
                 "rows_consolidated": len(consolidated),
                 "has_unrealized_pnl": bool(unrealized_pnl),
                 "markdown_report": str(md_path),
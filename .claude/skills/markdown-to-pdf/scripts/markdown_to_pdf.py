@@ -88,8 +88,10 @@ _ALWAYS_SUBS = {
     "↓": "v",
     "→": "->",
     "←": "<-",
-    "'": "'",
-    """: '"', """: '"',
+    "\u2018": "'",
+    "\u2019": "'",
+    "\u201c": '"',
+    "\u201d": '"',
     "–": "-",
     "—": "--",
     "…": "...",
@@ -152,6 +154,10 @@ _LATIN1_SUBS = {
     "·": ".",
 }
 
+# Single-pass translation tables; _sanitize runs on every inline text fragment.
+_ALWAYS_TABLE = str.maketrans(_ALWAYS_SUBS)
+_LATIN1_TABLE = str.maketrans(_LATIN1_SUBS)
+
 # ---------------------------------------------------------------------------
 # Sentinel bytes for passing structured data through string-concat pipeline
 # ---------------------------------------------------------------------------
@@ -159,6 +165,8 @@ _CELL_SEP = "\x00C\x00"
 _HEAD_ROW = "\x01H\x01"
 _BODY_ROW = "\x01R\x01"
 _LIST_ITEM = "\x02I\x02"
+_ROW_SPLIT = re.compile(r"(\x01[HR]\x01)")
+_CELL_SPLIT = re.compile(re.escape(_CELL_SEP))
 
 # ---------------------------------------------------------------------------
 # Visual constants
@@ -256,12 +264,10 @@ def _build_styles(font: str) -> dict:
 
 def _sanitize(text: str, unicode_font: bool) -> str:
     """Replace characters unsupported by the chosen font."""
-    for ch, rep in _ALWAYS_SUBS.items():
-        text = text.replace(ch, rep)
-    if unicode_font:
+    text = text.translate(_ALWAYS_TABLE)
+    if unicode_font or text.isascii():
         return text
-    for ch, rep in _LATIN1_SUBS.items():
-        text = text.replace(ch, rep)
+    text = text.translate(_LATIN1_TABLE)
     result = []
     for ch in text:
         if ord(ch) < 256:
@@ -301,6 +307,8 @@ _MARKUP_SUBS = {
 
 def _apply_markup_subs(text: str) -> str:
     """Replace sentinels with ReportLab XML font markup."""
+    if "\x03" not in text:
+        return text
     for sentinel, markup in _MARKUP_SUBS.items():
         text = text.replace(sentinel, markup)
     return text
@@ -423,7 +431,7 @@ class _Renderer(mistune.HTMLRenderer):
         return text
 
     def table(self, text: str) -> str:
-        row_parts = re.split(r"(\x01[HR]\x01)", text)
+        row_parts = _ROW_SPLIT.split(text)
         # pairs: (marker, content)
         rows = []
         i = 0
@@ -438,7 +446,7 @@ class _Renderer(mistune.HTMLRenderer):
         is_head_row = []
 
         for marker, row_str in rows:
-            cells_raw = re.split(re.escape(_CELL_SEP), row_str)
+            cells_raw = _CELL_SPLIT.split(row_str)
             row_cells = []
             for cell in cells_raw:
                 if not cell.strip():
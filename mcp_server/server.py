@@ -16,25 +16,6 @@ from importlib.metadata import version as pkg_version
 
 from mcp.server.fastmcp import FastMCP
 
-from trading_skills.broker.account import get_account_summary
-from trading_skills.broker.collar import find_collar_candidates
-from trading_skills.broker.delta_exposure import get_delta_exposure
-from trading_skills.broker.options import (
-    get_expiries as ib_get_expiries,
-)
-from trading_skills.broker.options import (
-    get_option_chain as ib_get_option_chain,
-)
-from trading_skills.broker.pmcc_advisor import get_pmcc_data
-from trading_skills.broker.portfolio import get_portfolio
-from trading_skills.broker.portfolio_action import (
-    analyze_portfolio,
-    get_portfolio_data,
-)
-from trading_skills.broker.roll import find_roll_candidates
-from trading_skills.broker.stop_loss import get_stop_loss_data
-from trading_skills.broker.trades import get_trades
-from trading_skills.broker.trailing_stop import get_trailing_stop_data
 from trading_skills.correlation import compute_correlation
 from trading_skills.earnings import get_earnings_info, get_multiple_earnings
 from trading_skills.fundamentals import get_fundamentals
@@ -254,10 +235,11 @@ def option_expiries(symbol: str) -> dict:
     Args:
         symbol: Ticker symbol
     """
-    expiries = get_expiries(symbol.upper())
+    symbol = symbol.upper()
+    expiries = get_expiries(symbol)
     if not expiries:
         return {"error": f"No options found for {symbol}"}
-    return {"symbol": symbol.upper(), "expiries": expiries}
+    return {"symbol": symbol, "expiries": expiries}
 
 
 @mcp.tool()
@@ -513,9 +495,10 @@ def whale_hunting(
     """
     import pandas as pd
 
+    symbol = symbol.upper()
     try:
         result = whales_hunter(
-            symbol.upper(),
+            symbol,
             max_months=max_months,
             precise=True,
             sigma_z=sigma_z,
@@ -533,7 +516,7 @@ def whale_hunting(
     )
 
     output = {
-        "underlying": symbol.upper(),
+        "underlying": symbol,
         "trading_date": str(result["trading_date"]),
         "source": result["source"],
         "total_whales": len(whales),
@@ -579,12 +562,14 @@ def report_stock(symbol: str) -> dict:
     Args:
         symbol: Ticker symbol (e.g., AAPL, MSFT)
     """
-    return generate_report_data(symbol.upper())
+    return generate_report_data(symbol)
 
 
 # ============================================================================
 # INTERACTIVE BROKERS TOOLS (Requires TWS/Gateway)
 # ============================================================================
+# Broker modules are imported inside each tool so ib_async is only loaded once
+# an IB tool is actually called, keeping MCP server startup fast.
 
 
 @mcp.tool()
@@ -597,6 +582,8 @@ async def ib_account(port: int = 7497) -> dict:
     Args:
         port: IB port (7496 for live, 7497 for paper)
     """
+    from trading_skills.broker.account import get_account_summary
+
     return await get_account_summary(port, all_accounts=True)
 
 
@@ -611,6 +598,8 @@ async def ib_portfolio(port: int = 7497, account: str | None = None) -> dict:
         port: IB port (7496 for live, 7497 for paper)
         account: Specific account ID (optional, uses first if not specified)
     """
+    from trading_skills.broker.portfolio import get_portfolio
+
     return await get_portfolio(port, account, all_accounts=True)
 
 
@@ -639,6 +628,8 @@ async def ib_find_short_roll(
         expiry: Current expiry YYYYMMDD (optional, auto-detects from portfolio)
         right: 'C' for call or 'P' for put (default: C)
     """
+    from trading_skills.broker.roll import find_roll_candidates
+
     return await find_roll_candidates(
         symbol=symbol, port=port, account=account, strike=strike, expiry=expiry, right=right
     )
@@ -659,6 +650,8 @@ async def ib_portfolio_action_report(
         port: IB port (7496 for live, 7497 for paper)
         account: Specific account ID (optional)
     """
+    from trading_skills.broker.portfolio_action import analyze_portfolio, get_portfolio_data
+
     data = await get_portfolio_data(port, account)
 
     if "error" in data:
@@ -677,7 +670,9 @@ async def ib_option_expiries(symbol: str, port: int = 7497) -> dict:
         symbol: Ticker symbol
         port: IB port (7496 for live, 7497 for paper)
     """
-    return await ib_get_expiries(symbol.upper(), port=port)
+    from trading_skills.broker.options import get_expiries as ib_get_expiries
+
+    return await ib_get_expiries(symbol, port=port)
 
 
 @mcp.tool()
@@ -692,7 +687,9 @@ async def ib_option_chain(symbol: str, expiry: str, port: int = 7497) -> dict:
         expiry: Expiration date (YYYYMMDD)
         port: IB port (7496 for live, 7497 for paper)
     """
-    return await ib_get_option_chain(symbol.upper(), expiry, port=port)
+    from trading_skills.broker.options import get_option_chain as ib_get_option_chain
+
+    return await ib_get_option_chain(symbol, expiry, port=port)
 
 
 @mcp.tool()
@@ -706,6 +703,8 @@ async def ib_delta_exposure(port: int = 7497) -> dict:
     Args:
         port: IB port (7496 for live, 7497 for paper)
     """
+    from trading_skills.broker.delta_exposure import get_delta_exposure
+
     return await get_delta_exposure(port)
 
 
@@ -730,6 +729,8 @@ async def ib_pmcc_advisor(
         min_roll_dte: Minimum DTE for roll candidates (default 7)
         price_mode: Option price source — 'mid' (bid+ask)/2 or 'last'
     """
+    from trading_skills.broker.pmcc_advisor import get_pmcc_data
+
     symbol_list = [s.strip().upper() for s in symbols.split(",")] if symbols else None
     return await get_pmcc_data(
         port=port,
@@ -757,6 +758,8 @@ async def ib_collar(
         port: IB port (7496 for live, 7497 for paper)
         account: Account ID (optional)
     """
+    from trading_skills.broker.collar import find_collar_candidates
+
     return await find_collar_candidates(symbol, port, account)
 
 
@@ -790,6 +793,8 @@ async def ib_stop_loss(
         execute: Place conditional stop-loss orders (default False = dry-run)
         forced: Use current mid as basis, can lower existing stops (requires execute=True)
     """
+    from trading_skills.broker.stop_loss import get_stop_loss_data
+
     symbol_list = [s.strip().upper() for s in symbols.split(",")] if symbols else None
     return await get_stop_loss_data(
         port=port,
@@ -832,6 +837,8 @@ async def ib_trailing_stop(
         forced: Cancel and replace existing TS_ orders with current parameters
             (requires execute=True)
     """
+    from trading_skills.broker.trailing_stop import get_trailing_stop_data
+
     symbol_list = [s.strip().upper() for s in symbols.split(",")] if symbols else None
     return await get_trailing_stop_data(
         port=port,
@@ -873,6 +880,8 @@ async def ib_trades_history(
             of IDs to merge and deduplicate results from multiple queries — useful
             for spans exceeding the FlexReport 365-day per-query limit.
     """
+    from trading_skills.broker.trades import get_trades
+
     return await get_trades(
         port=port,
         account=account,
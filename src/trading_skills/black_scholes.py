@@ -3,7 +3,25 @@
 
 import math
 
-from scipy.stats import norm
+import numpy as np
+from scipy.special import ndtr
+
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+_INV_SQRT_2 = 1.0 / math.sqrt(2.0)
+
+
+def _cdf(x: float) -> float:
+    """Standard normal CDF for scalars.
+
+    math.erfc keeps full tail accuracy at a tenth of the cost of a ufunc call on a
+    Python float; array inputs go through scipy.special.ndtr instead.
+    """
+    return 0.5 * math.erfc(-x * _INV_SQRT_2)
+
+
+def _pdf(x: float) -> float:
+    """Standard normal PDF (avoids scipy.stats.norm's per-call dispatch overhead)."""
+    return math.exp(-0.5 * x * x) * _INV_SQRT_2PI
 
 
 def _d1_d2(
@@ -38,9 +56,36 @@ def black_scholes_price(
     d1, d2 = _d1_d2(S, K, T, r, sigma, q)
 
     if option_type == "call":
-        return S * math.exp(-q * T) * norm.cdf(d1) - K * math.exp(-r * T) * norm.cdf(d2)
+        return S * math.exp(-q * T) * _cdf(d1) - K * math.exp(-r * T) * _cdf(d2)
+    else:
+        return K * math.exp(-r * T) * _cdf(-d2) - S * math.exp(-q * T) * _cdf(-d1)
+
+
+def black_scholes_price_vec(S, K, T, r: float, sigma, option_type: str, q: float = 0.0):
+    """Vectorized black_scholes_price over NumPy-broadcastable S, K, T and sigma.
+
+    Elements with T <= 0 or sigma <= 0 take intrinsic value, as in the scalar version.
+    """
+    S, K, T, sigma = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (S, K, T, sigma)))
+    live = (T > 0) & (sigma > 0)
+    # Substitute harmless values where the intrinsic branch applies so the log/sqrt
+    # below never see zero or negative inputs.
+    T_ = np.where(live, T, 1.0)
+    sigma_ = np.where(live, sigma, 1.0)
+
+    sqrt_T = np.sqrt(T_)
+    d1 = (np.log(S / K) + (r - q + 0.5 * sigma_**2) * T_) / (sigma_ * sqrt_T)
+    d2 = d1 - sigma_ * sqrt_T
+    disc_r = np.exp(-r * T_)
+    disc_q = np.exp(-q * T_)
+
+    if option_type == "call":
+        price = S * disc_q * ndtr(d1) - K * disc_r * ndtr(d2)
+        intrinsic = np.maximum(S - K, 0.0)
     else:
-        return K * math.exp(-r * T) * norm.cdf(-d2) - S * math.exp(-q * T) * norm.cdf(-d1)
+        price = K * disc_r * ndtr(-d2) - S * disc_q * ndtr(-d1)
+        intrinsic = np.maximum(K - S, 0.0)
+    return np.where(live, price, intrinsic)
 
 
 def black_scholes_vega(
@@ -51,7 +96,7 @@ def black_scholes_vega(
         return 0.0
 
     d1, _ = _d1_d2(S, K, T, r, sigma, q)
-    return S * math.exp(-q * T) * norm.pdf(d1) * math.sqrt(T)
+    return S * math.exp(-q * T) * _pdf(d1) * math.sqrt(T)
 
 
 def black_scholes_delta(
@@ -77,53 +122,79 @@ def black_scholes_delta(
     d1, _ = _d1_d2(S, K, T, r, sigma, q)
 
     if option_type == "call":
-        return math.exp(-q * T) * norm.cdf(d1)
+        return math.exp(-q * T) * _cdf(d1)
     else:
-        return math.exp(-q * T) * (norm.cdf(d1) - 1.0)
+        return math.exp(-q * T) * (_cdf(d1) - 1.0)
 
 
-def black_scholes_greeks(
-    S: float, K: float, T: float, r: float, sigma: float, option_type: str, q: float = 0.0
-) -> dict:
-    """Calculate all Black-Scholes Greeks (q = continuous dividend yield)."""
-    if T <= 0:
-        return {"error": "Option has expired"}
+def black_scholes_delta_vec(S, K, T, r: float, sigma, is_call, q: float = 0.0):
+    """Vectorized black_scholes_delta over NumPy-broadcastable inputs.
+
+    is_call is a boolean array picking call or put delta per element, so mixed books
+    take one call. Elements with T <= 0 or sigma <= 0 take the expiry step delta, as
+    in the scalar version.
+    """
+    S, K, T, sigma = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (S, K, T, sigma)))
+    is_call = np.broadcast_to(np.asarray(is_call, dtype=bool), S.shape)
+    live = (T > 0) & (sigma > 0)
+    T_ = np.where(live, T, 1.0)
+    sigma_ = np.where(live, sigma, 1.0)
+
+    d1 = (np.log(S / K) + (r - q + 0.5 * sigma_**2) * T_) / (sigma_ * np.sqrt(T_))
+    n_d1 = ndtr(d1)
+    delta = np.exp(-q * T_) * np.where(is_call, n_d1, n_d1 - 1.0)
+    expired = np.where(is_call, (S > K).astype(float), -(S < K).astype(float))
+    return np.where(live, delta, expired)
 
-    if sigma <= 0:
-        return {"error": "Invalid volatility"}
 
+def _bs_core(
+    S: float, K: float, T: float, r: float, sigma: float, option_type: str, q: float = 0.0
+) -> tuple[float, float, float, float, float, float, float, float]:
+    """Price and all Greeks from one d1/d2 pass, unrounded.
+
+    Returns (price, delta, gamma, theta, vega, rho, d1, d2) with theta per day and
+    vega/rho per 1% move, as reported by black_scholes_greeks. Requires T > 0 and
+    sigma > 0.
+    """
     d1, d2 = _d1_d2(S, K, T, r, sigma, q)
     sqrt_T = math.sqrt(T)
 
-    N_d1 = norm.cdf(d1)
-    N_d2 = norm.cdf(d2)
-    n_d1 = norm.pdf(d1)
+    n_d1 = _pdf(d1)
     disc_q = math.exp(-q * T)
+    disc_r = math.exp(-r * T)
+    decay = -S * disc_q * n_d1 * sigma / (2 * sqrt_T)
 
     if option_type == "call":
+        N_d1 = _cdf(d1)
+        N_d2 = _cdf(d2)
         delta = disc_q * N_d1
-        theta = (
-            -S * disc_q * n_d1 * sigma / (2 * sqrt_T)
-            - r * K * math.exp(-r * T) * N_d2
-            + q * S * disc_q * N_d1
-        ) / 365
-        rho = K * T * math.exp(-r * T) * N_d2 / 100
-        price = S * disc_q * N_d1 - K * math.exp(-r * T) * N_d2
+        theta = (decay - r * K * disc_r * N_d2 + q * S * disc_q * N_d1) / 365
+        rho = K * T * disc_r * N_d2 / 100
+        price = S * disc_q * N_d1 - K * disc_r * N_d2
     else:
-        delta = disc_q * (N_d1 - 1)
-        N_neg_d1 = norm.cdf(-d1)
-        N_neg_d2 = norm.cdf(-d2)
-        theta = (
-            -S * disc_q * n_d1 * sigma / (2 * sqrt_T)
-            + r * K * math.exp(-r * T) * N_neg_d2
-            - q * S * disc_q * N_neg_d1
-        ) / 365
-        rho = -K * T * math.exp(-r * T) * N_neg_d2 / 100
-        price = K * math.exp(-r * T) * N_neg_d2 - S * disc_q * N_neg_d1
+        N_neg_d1 = _cdf(-d1)
+        N_neg_d2 = _cdf(-d2)
+        delta = -disc_q * N_neg_d1
+        theta = (decay + r * K * disc_r * N_neg_d2 - q * S * disc_q * N_neg_d1) / 365
+        rho = -K * T * disc_r * N_neg_d2 / 100
+        price = K * disc_r * N_neg_d2 - S * disc_q * N_neg_d1
 
     gamma = disc_q * n_d1 / (S * sigma * sqrt_T)
     vega = S * disc_q * n_d1 * sqrt_T / 100
+    return price, delta, gamma, theta, vega, rho, d1, d2
 
+
+def black_scholes_greeks(
+    S: float, K: float, T: float, r: float, sigma: float, option_type: str, q: float = 0.0
+) -> dict:
+    """Calculate all Black-Scholes Greeks (q = continuous dividend yield)."""
+    if T <= 0:
+        return {"error": "Option has expired"}
+
+    if sigma <= 0:
+        return {"error": "Invalid volatility"}
+
+    price, delta, gamma, theta, vega, rho, _, _ = _bs_core(S, K, T, r, sigma, option_type, q)
     return {
         "price": round(price, 4),
         "delta": round(delta, 4),
@@ -134,6 +205,24 @@ def black_scholes_greeks(
     }
 
 
+def _bs_price_and_vega(
+    S: float, K: float, T: float, r: float, sigma: float, option_type: str, q: float = 0.0
+) -> tuple[float, float, float, float]:
+    """Price and vega sharing one d1/d2 evaluation; returns (price, vega, d1, d2).
+
+    Requires T > 0 and sigma > 0.
+    """
+    d1, d2 = _d1_d2(S, K, T, r, sigma, q)
+    disc_r = math.exp(-r * T)
+    disc_q = math.exp(-q * T)
+    if option_type == "call":
+        price = S * disc_q * _cdf(d1) - K * disc_r * _cdf(d2)
+    else:
+        price = K * disc_r * _cdf(-d2) - S * disc_q * _cdf(-d1)
+    vega = S * disc_q * _pdf(d1) * math.sqrt(T)
+    return price, vega, d1, d2
+
+
 def implied_volatility(
     market_price: float,
     S: float,
@@ -145,7 +234,11 @@ def implied_volatility(
     max_iterations: int = 100,
     tolerance: float = 1e-6,
 ) -> float | None:
-    """Calculate implied volatility using Newton-Raphson with bisection fallback.
+    """Calculate implied volatility using Halley's method with bisection fallback.
+
+    Starts from the inflection point of price in sigma, sqrt(2|ln(F/K)|/T), from
+    which the iteration converges in a handful of steps. Volga (vega * d1 * d2 /
+    sigma) gives the second-order term.
 
     q is the continuous dividend yield; ignoring it biases recovered IV
     (downward for calls on dividend payers).
@@ -153,12 +246,11 @@ def implied_volatility(
     if market_price <= 0 or T <= 0:
         return None
 
-    # Initial guess based on ATM approximation
-    sigma = 0.3
+    log_moneyness = math.log(S / K) + (r - q) * T
+    sigma = min(max(math.sqrt(2 * abs(log_moneyness) / T), 0.001), 5.0)
 
     for _ in range(max_iterations):
-        price = black_scholes_price(S, K, T, r, sigma, option_type, q)
-        vega = black_scholes_vega(S, K, T, r, sigma, q)
+        price, vega, d1, d2 = _bs_price_and_vega(S, K, T, r, sigma, option_type, q)
 
         if vega < 1e-10:
             return _implied_volatility_bisection(market_price, S, K, T, r, option_type, q)
@@ -167,7 +259,12 @@ def implied_volatility(
         if abs(diff) < tolerance:
             return sigma
 
-        sigma = sigma - diff / vega
+        volga = vega * d1 * d2 / sigma
+        denom = 2 * vega * vega - diff * volga
+        if denom > 0:
+            sigma = sigma - 2 * diff * vega / denom
+        else:
+            sigma = sigma - diff / vega
 
         if sigma <= 0.001:
             sigma = 0.001
@@ -206,20 +303,23 @@ def _implied_volatility_bisection(
     return (low + high) / 2
 
 
+# estimate_iv buckets: deep ITM options trade below the base IV, deep OTM above it.
+_BASE_IV = 0.35
+_ITM_IV = _BASE_IV * 0.8
+_OTM_IV = _BASE_IV * 1.3
+
+
 def estimate_iv(spot: float, strike: float, dte_years: float, option_type: str) -> float:
     """Estimate IV based on moneyness - rough approximation when market IV unavailable."""
-    base_iv = 0.35
     moneyness = spot / strike
-
     if option_type == "call":
-        if moneyness > 1.1:  # Deep ITM
-            return base_iv * 0.8
-        elif moneyness < 0.9:  # Deep OTM
-            return base_iv * 1.3
-    else:
-        if moneyness < 0.9:  # Deep ITM put
-            return base_iv * 0.8
-        elif moneyness > 1.1:  # Deep OTM put
-            return base_iv * 1.3
+        return _ITM_IV if moneyness > 1.1 else (_OTM_IV if moneyness < 0.9 else _BASE_IV)
+    return _ITM_IV if moneyness < 0.9 else (_OTM_IV if moneyness > 1.1 else _BASE_IV)
+
 
-    return base_iv
+def estimate_iv_vec(spot, strike, is_call):
+    """Vectorized estimate_iv; is_call is a boolean array (call or put per element)."""
+    moneyness = np.asarray(spot, dtype=float) / np.asarray(strike, dtype=float)
+    itm = np.where(is_call, moneyness > 1.1, moneyness < 0.9)
+    otm = np.where(is_call, moneyness < 0.9, moneyness > 1.1)
+    return np.select([itm, otm], [_ITM_IV, _OTM_IV], _BASE_IV)
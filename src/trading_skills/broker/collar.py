@@ -1,12 +1,17 @@
 # ABOUTME: Analyzes tactical collar strategies for PMCC positions.
 # ABOUTME: Evaluates earnings risk and recommends optimal put protection.
 
+import asyncio
+import bisect
 import math
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import numpy as np
 import yfinance as yf
 
-from trading_skills.black_scholes import black_scholes_price
+from trading_skills.black_scholes import black_scholes_price_vec
 from trading_skills.broker.connection import (
     CLIENT_IDS,
     fetch_positions,
@@ -14,36 +19,92 @@ from trading_skills.broker.connection import (
     ib_connection,
     normalize_positions,
 )
+from trading_skills.cache import cached
 from trading_skills.earnings import get_next_earnings_date
 from trading_skills.options import get_expiries
-from trading_skills.utils import annualized_volatility, format_expiry_iso
+from trading_skills.utils import format_expiry_iso
+
+# yf.Ticker instances carry the expiry list and HTTP session, so one per symbol is
+# shared across lookups for TICKER_TTL seconds. Put chains are memoized for a much
+# shorter PUT_CHAIN_TTL, keyed by (symbol, expiry), since their quotes move.
+TICKER_TTL = 900
+PUT_CHAIN_TTL = 60
+_ticker_cache: dict[str, tuple[float, yf.Ticker]] = {}
+_put_chain_cache: dict[tuple[str, str], tuple[float, list[dict]]] = {}
+
+# On-disk TTLs (seconds), used only when the opt-in disk cache is enabled. Only
+# slow-moving lookups are stored: quotes and price history always come live, and
+# the put-chain freshness is decided by PUT_CHAIN_TTL above.
+EXPIRIES_DISK_TTL = 900
+EARNINGS_DISK_TTL = 7 * 86400
+
+# Annualized-vol class boundaries (a vol above each edge moves up one class).
+_VOL_CLASS_EDGES = (0.25, 0.40, 0.60, 0.80)
+_VOL_CLASSES = ("LOW", "MODERATE", "HIGH", "VERY HIGH", "EXTREME")
+
+
+def _get_ticker(symbol: str) -> yf.Ticker:
+    """Return a shared yf.Ticker for symbol, rebuilt once it is older than TICKER_TTL."""
+    entry = _ticker_cache.get(symbol)
+    if entry and time.monotonic() - entry[0] < TICKER_TTL:
+        return entry[1]
+    ticker = yf.Ticker(symbol)
+    _ticker_cache[symbol] = (time.monotonic(), ticker)
+    return ticker
+
+
+@cached(EARNINGS_DISK_TTL)
+def _next_earnings_date(symbol: str) -> str | None:
+    """get_next_earnings_date with the YYYY-MM-DD result cached on disk."""
+    return get_next_earnings_date(symbol)
+
+
+@cached(EXPIRIES_DISK_TTL)
+def _get_expiries(symbol: str) -> list[str]:
+    """get_expiries on the shared Ticker, with the expiry list cached on disk when enabled."""
+    return get_expiries(symbol, _get_ticker(symbol))
 
 
 def get_earnings_date(symbol: str) -> tuple[datetime | None, str]:
     """Get next earnings date for a symbol as (datetime, timing_str)."""
     try:
-        date_str = get_next_earnings_date(symbol)
+        date_str = _next_earnings_date(symbol)
         if date_str:
-            return datetime.strptime(date_str, "%Y-%m-%d"), "after market close"
+            return datetime.fromisoformat(date_str), "after market close"
     except Exception:
         pass
     return None, ""
 
 
+def _yf_current_price(symbol: str) -> float | None:
+    """Last price from yfinance's fast_info, else the previous close.
+
+    fast_info is lazy: the .get lookups are what download prices, so both run here
+    (off the event loop when called through asyncio.to_thread).
+    """
+    fi = _get_ticker(symbol).fast_info
+    return fi.get("lastPrice") or fi.get("previousClose")
+
+
 def get_stock_volatility(symbol: str, period: str = "3mo") -> dict:
     """Calculate stock's historical volatility and expected move."""
     try:
-        ticker = yf.Ticker(symbol)
+        ticker = _get_ticker(symbol)
         hist = ticker.history(period=period)
         if hist.empty or len(hist) < 20:
             return {"error": "Insufficient data"}
 
-        # Calculate volatility
-        returns, daily_vol, annual_vol = annualized_volatility(hist["Close"])
+        # Calculate volatility on the raw close array (same simple-return, sample-std
+        # definition as utils.annualized_volatility, without the Series round-trip)
+        close = hist["Close"].to_numpy(dtype=float)
+        returns = close[1:] / close[:-1] - 1.0
+        returns = returns[~np.isnan(returns)]
+        daily_vol = float(returns.std(ddof=1))
+        annual_vol = daily_vol * math.sqrt(252)
 
         # Calculate expected moves for different time periods
         # Using 1 standard deviation move
-        current_price = hist["Close"].iloc[-1]
+        current_price = float(close[-1])
 
         # Expected move over N days = price * daily_vol * sqrt(N)
         move_1_week = current_price * daily_vol * math.sqrt(5)
@@ -51,16 +112,7 @@ def get_stock_volatility(symbol: str, period: str = "3mo") -> dict:
         move_3_weeks = current_price * daily_vol * math.sqrt(15)
 
         # Volatility classification
-        if annual_vol > 0.80:
-            vol_class = "EXTREME"
-        elif annual_vol > 0.60:
-            vol_class = "VERY HIGH"
-        elif annual_vol > 0.40:
-            vol_class = "HIGH"
-        elif annual_vol > 0.25:
-            vol_class = "MODERATE"
-        else:
-            vol_class = "LOW"
+        vol_class = _VOL_CLASSES[bisect.bisect_left(_VOL_CLASS_EDGES, annual_vol)]
 
         return {
             "current_price": current_price,
@@ -79,89 +131,133 @@ def get_stock_volatility(symbol: str, period: str = "3mo") -> dict:
         return {"error": str(e)}
 
 
-def get_put_chain(symbol: str, target_expiry: str) -> list[dict]:
-    """Get put options for a specific expiry."""
+def get_put_chain(
+    symbol: str,
+    target_expiry: str,
+    ticker: yf.Ticker | None = None,
+    expiries: list[str] | None = None,
+) -> list[dict]:
+    """Get put options for a specific expiry (memoized).
+
+    ``ticker`` and an already-fetched ``expiries`` list are reused when given.
+    """
+    key = (symbol, target_expiry)
+    entry = _put_chain_cache.get(key)
+    if entry and time.monotonic() - entry[0] < PUT_CHAIN_TTL:
+        return entry[1]
+
+    result = _fetch_put_chain(symbol, target_expiry, ticker, expiries)
+    if result:
+        _put_chain_cache[key] = (time.monotonic(), result)
+    return result
+
+
+def _fetch_put_chain(
+    symbol: str, target_expiry: str, ticker: yf.Ticker | None, expiries: list[str] | None
+) -> list[dict]:
+    """Download and flatten the yfinance put chain for one expiry."""
     try:
-        ticker = yf.Ticker(symbol)
-        if target_expiry not in ticker.options:
+        ticker = ticker or _get_ticker(symbol)
+        if target_expiry not in (ticker.options if expiries is None else expiries):
             return []
         chain = ticker.option_chain(target_expiry)
         puts = chain.puts
-        result = []
-        for _, row in puts.iterrows():
-            result.append(
-                {
-                    "strike": row["strike"],
-                    "bid": row["bid"],
-                    "ask": row["ask"],
-                    "mid": (row["bid"] + row["ask"]) / 2,
-                    "oi": row["openInterest"],
-                    "iv": row.get("impliedVolatility", 0.4),
-                }
-            )
-        return result
+        # Pull whole columns out once instead of materializing a Series per row.
+        bid = puts["bid"].to_numpy()
+        ask = puts["ask"].to_numpy()
+        if "impliedVolatility" in puts:
+            iv = puts["impliedVolatility"].tolist()
+        else:
+            iv = [0.4] * len(puts)
+        columns = (
+            puts["strike"].tolist(),
+            bid.tolist(),
+            ask.tolist(),
+            ((bid + ask) / 2).tolist(),
+            puts["openInterest"].tolist(),
+            iv,
+        )
+        keys = ("strike", "bid", "ask", "mid", "oi", "iv")
+        return [dict(zip(keys, values)) for values in zip(*columns)]
     except Exception:
         return []
 
 
-def get_call_market_price(symbol: str, strike: float, expiry: str) -> float | None:
+def get_call_market_price(
+    symbol: str,
+    strike: float,
+    expiry: str,
+    ticker: yf.Ticker | None = None,
+    expiries: list[str] | None = None,
+) -> float | None:
     """Get actual market price for a call option.
 
     Args:
         symbol: Stock symbol
         strike: Option strike price
         expiry: Expiry date in YYYYMMDD format (from IB) or YYYY-MM-DD format
+        ticker: Existing yf.Ticker for symbol to reuse (optional)
+        expiries: Already-fetched YYYY-MM-DD expiry list to reuse (optional)
 
     Returns:
         Mid price of the option, or None if not found
     """
     try:
-        ticker = yf.Ticker(symbol)
+        ticker = ticker or _get_ticker(symbol)
 
         # Convert YYYYMMDD to YYYY-MM-DD if needed
         expiry_formatted = format_expiry_iso(expiry)
 
         # Get available expiries and find closest match
-        available = ticker.options
+        available = ticker.options if expiries is None else expiries
         if expiry_formatted not in available:
-            # Try to find the closest expiry
-            target_date = datetime.strptime(expiry_formatted, "%Y-%m-%d")
-            closest = None
-            min_diff = float("inf")
-            for exp in available:
-                exp_date = datetime.strptime(exp, "%Y-%m-%d")
-                diff = abs((exp_date - target_date).days)
-                if diff < min_diff:
-                    min_diff = diff
-                    closest = exp
-            if closest and min_diff <= 7:  # Within a week
-                expiry_formatted = closest
+            # Try to find the closest expiry (day distance via ordinals)
+            if not available:
+                return None
+            target_day = datetime.fromisoformat(expiry_formatted).toordinal()
+            ordinals = np.fromiter(
+                (datetime.fromisoformat(e).toordinal() for e in available),
+                dtype=np.int64,
+                count=len(available),
+            )
+            diffs = np.abs(ordinals - target_day)
+            idx = int(np.argmin(diffs))
+            if diffs[idx] <= 7:  # Within a week
+                expiry_formatted = available[idx]
             else:
                 return None
 
         chain = ticker.option_chain(expiry_formatted)
         calls = chain.calls
 
-        # Find the strike
-        matching = calls[calls["strike"] == strike]
-        if matching.empty:
-            # Try to find closest strike
-            if calls.empty:
-                return None
-            closest_idx = (calls["strike"] - strike).abs().idxmin()
-            matching = calls.loc[[closest_idx]]
-            if abs(matching.iloc[0]["strike"] - strike) > 5:  # More than $5 off
+        # Find the strike (or the closest one) by binary search on the sorted ladder
+        if calls.empty:
+            return None
+        if not calls["strike"].is_monotonic_increasing:
+            calls = calls.sort_values("strike", kind="stable")
+        strikes = calls["strike"].to_numpy()
+        i = int(np.searchsorted(strikes, strike))
+        if i < len(strikes) and strikes[i] == strike:
+            j = i
+        else:
+            # Nearest neighbour; ties go to the lower strike
+            j = min(
+                (k for k in (i - 1, i) if 0 <= k < len(strikes)),
+                key=lambda k: abs(strikes[k] - strike),
+            )
+            if abs(strikes[j] - strike) > 5:  # More than $5 off
                 return None
 
-        row = matching.iloc[0]
-        bid = row["bid"]
-        ask = row["ask"]
+        # Read the three quote fields by position rather than building a row Series
+        bid = calls["bid"].iat[j]
+        ask = calls["ask"].iat[j]
+        last = calls["lastPrice"].iat[j] if "lastPrice" in calls else 0
 
         # Use mid price, or last price if bid/ask is zero
         if bid > 0 and ask > 0:
             return (bid + ask) / 2
-        elif row.get("lastPrice", 0) > 0:
-            return row["lastPrice"]
+        elif last > 0:
+            return last
 
         return None
     except Exception as e:
@@ -169,37 +265,13 @@ def get_call_market_price(symbol: str, strike: float, expiry: str) -> float | No
         return None
 
 
-def analyze_collar(
-    symbol: str,
-    current_price: float,
-    long_strike: float,
-    long_expiry: str,
-    long_qty: int,
-    long_cost: float,
-    short_positions: list[dict],
-    earnings_date: datetime | None,
-) -> dict:
-    """Analyze tactical collar strategy for the position."""
+def _select_put_expiries(expiries: list[str], earnings_date: datetime | None) -> list[dict]:
+    """Pick up to 4 protective put expiries (after earnings when one is scheduled)."""
     today = datetime.now()
-
-    # Get stock volatility for timing recommendations
-    volatility = get_stock_volatility(symbol)
-
-    # PMCC health check
-    is_proper_pmcc = current_price >= long_strike * 0.95  # Within 5% of strike
-    short_above_long = all(s["strike"] >= long_strike for s in short_positions)
-
-    # Days to earnings
-    days_to_earnings = (earnings_date - today).days if earnings_date else None
-
-    # Get available expiries
-    expiries = get_expiries(symbol)
-
-    # Find suitable put expiries (after earnings if applicable)
     put_expiries = []
     if earnings_date and expiries:
         for exp in expiries:
-            exp_date = datetime.strptime(exp, "%Y-%m-%d")
+            exp_date = datetime.fromisoformat(exp)
             days_after_earnings = (exp_date - earnings_date).days
             days_from_now = (exp_date - today).days
             if 0 < days_after_earnings <= 60 and days_from_now > 0:
@@ -213,7 +285,7 @@ def analyze_collar(
     elif expiries:
         # No earnings, just get near-term expiries
         for exp in expiries[:6]:
-            exp_date = datetime.strptime(exp, "%Y-%m-%d")
+            exp_date = datetime.fromisoformat(exp)
             days_from_now = (exp_date - today).days
             if days_from_now > 7:
                 put_expiries.append(
@@ -224,88 +296,167 @@ def analyze_collar(
                     }
                 )
 
-    # Determine put strikes at various OTM levels (deduplicated)
-    put_strike_5 = round(current_price * 0.95 / 5) * 5  # 5% OTM, round to 5
-    put_strike_10 = round(current_price * 0.90 / 5) * 5  # 10% OTM
-    put_strike_15 = round(current_price * 0.85 / 5) * 5  # 15% OTM
-    # Deduplicate strikes (can happen when rounding)
-    put_strikes = list(dict.fromkeys([put_strike_15, put_strike_10, put_strike_5]))
+    return put_expiries[:4]
+
+
+def fetch_collar_market_data(
+    symbol: str, long_strike: float, long_expiry: str, earnings_date: datetime | None
+) -> dict:
+    """Fetch the yfinance inputs analyze_collar needs, overlapping the network calls.
+
+    Volatility is submitted first so it runs while the expiry list is fetched; that
+    list is then shared by the long-call quote and the per-expiry put chains, which
+    run together on the same small pool (Yahoo has no multi-expiry chain request).
+    """
+    ticker = _get_ticker(symbol)
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        volatility = pool.submit(get_stock_volatility, symbol)
+        available = _get_expiries(symbol)
+        long_call_price = pool.submit(
+            get_call_market_price, symbol, long_strike, long_expiry, ticker, available
+        )
+        put_expiries = _select_put_expiries(available, earnings_date)
+        expiries = [pe["expiry"] for pe in put_expiries]
+        chains = pool.map(lambda exp: get_put_chain(symbol, exp, ticker, available), expiries)
+        return {
+            "volatility": volatility.result(),
+            "put_expiries": put_expiries,
+            "put_chains": dict(zip(expiries, chains)),
+            "long_call_price": long_call_price.result(),
+        }
+
+
+async def fetch_collar_market_data_async(symbol: str, long_strike: float, long_expiry: str) -> dict:
+    """Async fetch_collar_market_data that also looks up the earnings date.
+
+    The blocking yfinance calls run in worker threads: earnings, volatility and the
+    expiry list are fetched together, then the long-call quote and the put chains
+    (which reuse that expiry list) follow as a second concurrent batch.
+    """
+    ticker = _get_ticker(symbol)
+    (earnings_date, _), volatility, expiries = await asyncio.gather(
+        asyncio.to_thread(get_earnings_date, symbol),
+        asyncio.to_thread(get_stock_volatility, symbol),
+        asyncio.to_thread(_get_expiries, symbol),
+    )
+    put_expiries = _select_put_expiries(expiries, earnings_date)
+    long_call_price, *chains = await asyncio.gather(
+        asyncio.to_thread(
+            get_call_market_price, symbol, long_strike, long_expiry, ticker, expiries
+        ),
+        *(
+            asyncio.to_thread(get_put_chain, symbol, pe["expiry"], ticker, expiries)
+            for pe in put_expiries
+        ),
+    )
+    return {
+        "earnings_date": earnings_date,
+        "volatility": volatility,
+        "put_expiries": put_expiries,
+        "put_chains": {pe["expiry"]: chain for pe, chain in zip(put_expiries, chains)},
+        "long_call_price": long_call_price,
+    }
+
+
+def analyze_collar(
+    symbol: str,
+    current_price: float,
+    long_strike: float,
+    long_expiry: str,
+    long_qty: int,
+    long_cost: float,
+    short_positions: list[dict],
+    earnings_date: datetime | None,
+    market: dict | None = None,
+) -> dict:
+    """Analyze tactical collar strategy for the position.
+
+    ``market`` carries the yfinance inputs from fetch_collar_market_data (or its
+    async variant); when omitted they are fetched here. ``put_analysis`` rows are
+    grouped by expiry in expiry order, so a report can start a new table whenever
+    the expiry changes instead of re-scanning the list per expiry.
+    """
+    today = datetime.now()
+    if market is None:
+        market = fetch_collar_market_data(symbol, long_strike, long_expiry, earnings_date)
+
+    # Stock volatility for timing recommendations
+    volatility = market["volatility"]
+
+    # PMCC health check
+    is_proper_pmcc = current_price >= long_strike * 0.95  # Within 5% of strike
+    short_above_long = all(s["strike"] >= long_strike for s in short_positions)
+
+    # Days to earnings
+    days_to_earnings = (earnings_date - today).days if earnings_date else None
+
+    # Put strikes 15%, 10% and 5% OTM rounded to $5 (half-to-even, like round()).
+    # np.unique drops duplicates from rounding and keeps them in ascending order.
+    otm_factors = np.array([0.85, 0.90, 0.95])
+    put_strikes = np.unique(np.round(current_price * otm_factors / 5).astype(int) * 5).tolist()
 
     # IV estimates
     iv_before = 0.50  # Elevated before earnings
     iv_after_up = 0.35  # Crushed after gap up
     iv_after_down = 0.45  # Stays elevated after gap down
 
-    # Analyze each put expiry
+    # Post-earnings scenarios as (name, underlying price, IV); all strikes of an expiry
+    # are priced against all scenarios in one vectorized Black-Scholes call.
+    scenario_names = ("gap_up_10", "flat", "gap_down_10", "gap_down_15")
+    scenario_prices = np.array(
+        [current_price * 1.10, current_price, current_price * 0.90, current_price * 0.85]
+    )
+    scenario_ivs = np.array([iv_after_up, 0.40, iv_after_down, iv_after_down])
+    strike_col = np.array(put_strikes, dtype=float)[:, None]
+    # Expiry-independent per-strike and per-scenario values, computed once.
+    otm_pcts = ((current_price - strike_col[:, 0]) / current_price * 100).tolist()
+    scenario_rows = list(zip(scenario_names, scenario_prices.tolist()))
+
+    # Analyze each put expiry; chains were fetched once per expiry, not per strike.
+    put_expiries = market["put_expiries"]
+    chains_by_expiry = market["put_chains"]
+    mult = long_qty * 100  # contracts -> dollars
     put_analysis = []
-    for pe in put_expiries[:4]:  # Analyze up to 4 expiries
+    for pe in put_expiries:
+        # First quote per strike wins, matching the previous linear scan. Keys are
+        # rounded to cents so float noise in Yahoo's strikes doesn't miss a match.
+        puts_by_strike = {
+            round(p["strike"], 2): p for p in reversed(chains_by_expiry[pe["expiry"]])
+        }
         T_before = pe["days_out"] / 365
         days_after = pe.get("days_after_earnings") or 7
         T_after = days_after / 365
 
-        for put_strike in put_strikes:
-            otm_pct = (current_price - put_strike) / current_price * 100
+        # Rows are strikes, columns are scenarios.
+        scenario_values = black_scholes_price_vec(
+            scenario_prices, strike_col, T_after, 0.05, scenario_ivs, "put"
+        )
+        # Gap-down puts are worth at least intrinsic value.
+        scenario_values[:, 2:] = np.maximum(
+            scenario_values[:, 2:], strike_col - scenario_prices[2:]
+        )
+        # Model entry cost for strikes missing from the chain, priced pre-earnings.
+        model_costs = black_scholes_price_vec(
+            current_price, strike_col[:, 0], T_before, 0.05, iv_before, "put"
+        )
 
+        rows = zip(put_strikes, otm_pcts, scenario_values.tolist(), model_costs.tolist())
+        for put_strike, otm_pct, strike_values, model_cost in rows:
             # Get actual put price if available
-            puts = get_put_chain(symbol, pe["expiry"])
-            actual_put = next((p for p in puts if p["strike"] == put_strike), None)
+            actual_put = puts_by_strike.get(round(put_strike, 2))
 
-            if actual_put:
-                put_cost = actual_put["mid"]
-            else:
-                put_cost = black_scholes_price(
-                    current_price, put_strike, T_before, 0.05, iv_before, "put"
-                )
+            put_cost = actual_put["mid"] if actual_put else model_cost
 
-            total_cost = put_cost * long_qty * 100
+            total_cost = put_cost * mult
 
             # Scenario analysis
             scenarios = {}
-
-            # Gap up 10%
-            price_up = current_price * 1.10
-            put_value_up = black_scholes_price(
-                price_up, put_strike, T_after, 0.05, iv_after_up, "put"
-            )
-            scenarios["gap_up_10"] = {
-                "price": price_up,
-                "put_value": put_value_up * long_qty * 100,
-                "put_pnl": (put_value_up - put_cost) * long_qty * 100,
-            }
-
-            # Flat
-            put_value_flat = black_scholes_price(
-                current_price, put_strike, T_after, 0.05, 0.40, "put"
-            )
-            scenarios["flat"] = {
-                "price": current_price,
-                "put_value": put_value_flat * long_qty * 100,
-                "put_pnl": (put_value_flat - put_cost) * long_qty * 100,
-            }
-
-            # Gap down 10%
-            price_down = current_price * 0.90
-            put_value_down = black_scholes_price(
-                price_down, put_strike, T_after, 0.05, iv_after_down, "put"
-            )
-            put_value_down = max(put_value_down, put_strike - price_down)  # At least intrinsic
-            scenarios["gap_down_10"] = {
-                "price": price_down,
-                "put_value": put_value_down * long_qty * 100,
-                "put_pnl": (put_value_down - put_cost) * long_qty * 100,
-            }
-
-            # Gap down 15%
-            price_down_15 = current_price * 0.85
-            put_value_down_15 = black_scholes_price(
-                price_down_15, put_strike, T_after, 0.05, iv_after_down, "put"
-            )
-            put_value_down_15 = max(put_value_down_15, put_strike - price_down_15)
-            scenarios["gap_down_15"] = {
-                "price": price_down_15,
-                "put_value": put_value_down_15 * long_qty * 100,
-                "put_pnl": (put_value_down_15 - put_cost) * long_qty * 100,
-            }
+            for (name, price), value in zip(scenario_rows, strike_values):
+                scenarios[name] = {
+                    "price": price,
+                    "put_value": value * mult,
+                    "put_pnl": (value - put_cost) * mult,
+                }
 
             put_analysis.append(
                 {
@@ -321,10 +472,10 @@ def analyze_collar(
             )
 
     # Calculate long call risk without protection
-    T_long = (datetime.strptime(long_expiry, "%Y%m%d") - today).days / 365
+    T_long = (datetime.fromisoformat(format_expiry_iso(long_expiry)) - today).days / 365
 
-    # Try to get actual market price for the long call
-    actual_long_price = get_call_market_price(symbol, long_strike, long_expiry)
+    # Actual market price for the long call, if yfinance had one
+    actual_long_price = market["long_call_price"]
 
     if actual_long_price:
         long_value_now = actual_long_price
@@ -338,20 +489,22 @@ def analyze_collar(
             long_value_down_15 = max(0.1, long_value_now * (0.55 * otm_ratio))
             long_value_up_10 = long_value_now + (current_price * 0.10 * 0.45)
     else:
-        long_value_now = black_scholes_price(current_price, long_strike, T_long, 0.05, 0.60, "call")
-        long_value_down_10 = black_scholes_price(
-            current_price * 0.90, long_strike, T_long, 0.05, 0.65, "call"
-        )
-        long_value_down_15 = black_scholes_price(
-            current_price * 0.85, long_strike, T_long, 0.05, 0.70, "call"
+        # Now, down 10%, down 15% and up 10%, each with its own IV, in one call.
+        long_values = black_scholes_price_vec(
+            current_price * np.array([1.0, 0.90, 0.85, 1.10]),
+            long_strike,
+            T_long,
+            0.05,
+            np.array([0.60, 0.65, 0.70, 0.50]),
+            "call",
         )
-        long_value_up_10 = black_scholes_price(
-            current_price * 1.10, long_strike, T_long, 0.05, 0.50, "call"
+        long_value_now, long_value_down_10, long_value_down_15, long_value_up_10 = (
+            float(v) for v in long_values
         )
 
-    unprotected_loss_10 = (long_value_now - long_value_down_10) * long_qty * 100
-    unprotected_loss_15 = (long_value_now - long_value_down_15) * long_qty * 100
-    unprotected_gain_10 = (long_value_up_10 - long_value_now) * long_qty * 100
+    unprotected_loss_10 = (long_value_now - long_value_down_10) * mult
+    unprotected_loss_15 = (long_value_now - long_value_down_15) * mult
+    unprotected_gain_10 = (long_value_up_10 - long_value_now) * mult
 
     return {
         "symbol": symbol,
@@ -394,13 +547,13 @@ async def find_collar_candidates(
             else:
                 accounts = managed
 
-            # Fetch and normalize positions
-            raw = []
-            for acct in accounts:
-                raw.extend(await fetch_positions(ib, account=acct))
+            # Fetch positions in one request, keep the selected accounts, and normalize
+            wanted = set(accounts)
+            raw = [p for p in await fetch_positions(ib) if p.account in wanted]
             positions = normalize_positions(raw)
 
-            # Fetch underlying prices for option positions
+            # Fetch underlying prices for option positions. The analysis needs a long
+            # call on the symbol, so its spot is in this batch whenever it is used.
             opt_symbols = {p["symbol"] for p in positions if p["sec_type"] == "OPT"}
             prices = await fetch_spot_prices(ib, list(opt_symbols))
             for pos in positions:
@@ -415,7 +568,7 @@ async def find_collar_candidates(
     symbol_positions = [p for p in positions if p["symbol"] == symbol]
 
     if not symbol_positions:
-        available = sorted(set(p["symbol"] for p in positions))
+        available = sorted({p["symbol"] for p in positions})
         return {"error": f"{symbol} not found in portfolio. Available: {available}"}
 
     # Separate long and short calls
@@ -434,21 +587,25 @@ async def find_collar_candidates(
         return {"error": f"No long call positions found for {symbol}. Requires a PMCC position."}
 
     # Use the longest-dated long call as the LEAPS
-    long_calls.sort(key=lambda x: x["expiry"], reverse=True)
-    main_long = long_calls[0]
-
-    # Get current price from IB data, fall back to yfinance
-    current_price = main_long.get("underlying_price")
-    if not current_price:
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
-        current_price = info.get("regularMarketPrice") or info.get("previousClose")
+    main_long = max(long_calls, key=lambda x: x["expiry"])
+
+    # Get current price from IB data, fall back to yfinance's lightweight fast_info
+    async def _current_price():
+        price = main_long.get("underlying_price")
+        if price:
+            return price
+        return await asyncio.to_thread(_yf_current_price, symbol)
+
+    # The yfinance lookups are independent, so they run concurrently off the loop.
+    current_price, market = await asyncio.gather(
+        _current_price(),
+        fetch_collar_market_data_async(symbol, main_long["strike"], main_long["expiry"]),
+    )
 
     if not current_price:
         return {"error": f"Could not get current price for {symbol}"}
 
-    # Get earnings date
-    earnings_date, _ = get_earnings_date(symbol)
+    earnings_date = market["earnings_date"]
 
     # Format short positions
     short_positions = [
@@ -466,6 +623,7 @@ async def find_collar_candidates(
         long_cost=main_long["avg_cost"],
         short_positions=short_positions,
         earnings_date=earnings_date,
+        market=market,
     )
 
     # Serialize datetime for JSON
@@ -72,8 +72,16 @@ async def ib_connection(port: int, client_id: int, readonly: bool = True):
 
 
 async def fetch_positions(ib: IB, account: str | None = None, sleep: float = 2) -> list:
-    """Fetch raw IB Position objects, optionally filtered by account."""
-    await asyncio.sleep(sleep)
+    """Fetch raw IB Position objects, optionally filtered by account.
+
+    Waits for IB's positionEnd (at most sleep seconds) instead of a fixed delay;
+    on timeout the positions synced during connect are returned.
+    """
+    if sleep > 0:
+        try:
+            await asyncio.wait_for(ib.reqPositionsAsync(), timeout=sleep)
+        except asyncio.TimeoutError:
+            pass
     positions = ib.positions()
     if account:
         positions = [p for p in positions if p.account == account]
@@ -122,6 +130,54 @@ def best_option_chain(chains: list):
     return max(pool, key=lambda c: len(c.expirations))
 
 
+# IB silently drops quotes once too many market-data lines stream at once. Tickers
+# are requested in chunks of QUOTE_BATCH_LINES with at most
+# MAX_CONCURRENT_QUOTE_BATCHES chunks in flight; callers that issue several requests
+# together pass one shared semaphore so the cap holds across all of them.
+QUOTE_BATCH_LINES = 30
+MAX_CONCURRENT_QUOTE_BATCHES = 2
+
+
+def _chunks(items: list, size: int) -> list[list]:
+    """Split a list into consecutive chunks of at most ``size`` items."""
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+async def req_tickers_batched(
+    ib: IB,
+    contracts: list,
+    sem: asyncio.Semaphore | None = None,
+    timeout: float = 30,
+    qualify: bool = False,
+) -> list:
+    """reqTickersAsync over contracts in QUOTE_BATCH_LINES-sized chunks.
+
+    Chunks are issued together via asyncio.gather; ``sem`` caps how many stream at
+    once so the IB line limit holds. With qualify=True each chunk is qualified first
+    and its tickers are requested as soon as it resolves, so one chunk's ticker round
+    trip overlaps the next chunk's qualification. A chunk that times out or fails
+    contributes no tickers instead of discarding the whole request.
+    """
+    sem = sem or asyncio.Semaphore(MAX_CONCURRENT_QUOTE_BATCHES)
+
+    async def _one(chunk: list) -> list:
+        if qualify:
+            qualified = await fetch_with_timeout(
+                ib.qualifyContractsAsync(*chunk), timeout=timeout, default=[]
+            )
+            chunk = [qc for qc in qualified or [] if qc is not None]
+            if not chunk:
+                return []
+        async with sem:
+            tickers = await fetch_with_timeout(
+                ib.reqTickersAsync(*chunk), timeout=timeout, default=[]
+            )
+        return list(tickers or [])
+
+    batches = await asyncio.gather(*(_one(c) for c in _chunks(contracts, QUOTE_BATCH_LINES)))
+    return [t for batch in batches for t in batch]
+
+
 async def fetch_spot_prices(ib: IB, symbols: list[str], timeout: float = 15.0) -> dict[str, float]:
     """Fetch spot prices for stock symbols. Returns {symbol: price} dict.
 
@@ -1,12 +1,36 @@
 # ABOUTME: Consolidates IBRK trade CSV files by grouping and aggregating.
 # ABOUTME: Groups trades by symbol, underlying, date, strike, buy/sell, and open/close.
 
-import asyncio
-import csv
+import math
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
+# Consolidation works without ib_async; only fetch_unrealized_pnl needs it
+try:
+    from trading_skills.broker.connection import (
+        CLIENT_IDS,
+        fetch_positions,
+        ib_connection,
+        req_tickers_batched,
+    )
+
+    _IB_AVAILABLE = True
+except ImportError:
+    _IB_AVAILABLE = False
+
+# A fetched unrealized P&L is reused in-process for PNL_TTL seconds, keyed by port.
+# Nothing is written to disk: the result is account data.
+PNL_TTL = 30
+_pnl_cache: dict[int | None, tuple[float, tuple[dict[str, float], str | None]]] = {}
+
 # Key columns for grouping
-GROUP_COLS = [
+GROUP_COLS = (
     "UnderlyingSymbol",
     "Symbol",
     "TradeDate",
@@ -14,23 +38,23 @@ GROUP_COLS = [
     "Put/Call",
     "Buy/Sell",
     "Open/CloseIndicator",
-]
+)
 
 # Columns to aggregate (sum)
-AGG_COLS = [
+AGG_COLS = (
     "Quantity",
     "Proceeds",
     "NetCash",
     "IBCommission",
     "FifoPnlRealized",
-]
+)
 
 # Additional columns to keep (first value in group)
-KEEP_COLS = [
+KEEP_COLS = (
     "ClientAccountID",
     "Description",
     "Expiry",
-]
+)
 
 
 def determine_position(buy_sell: str, open_close: str) -> str:
@@ -44,136 +68,197 @@ def determine_position(buy_sell: str, open_close: str) -> str:
         return "CLOSE_SHORT" if buy_sell == "BUY" else "CLOSE_LONG"
 
 
-def read_csv_files(directory: Path) -> tuple[list[dict], list[Path]]:
-    """Read all CSV files in directory (not subdirectories).
+# Every column consolidation reads; other export columns are dropped on load
+_USED_COLS = GROUP_COLS + AGG_COLS + KEEP_COLS
 
-    Returns tuple of (rows, processed_files).
+# Order of consolidated output
+_SORT_COLS = ("UnderlyingSymbol", "TradeDate", "Symbol")
+
+
+# Files are parsed concurrently: multi-year exports split into many CSVs
+_READ_WORKERS = 8
+
+
+def _map_files(parse, csv_files: list[Path]) -> list:
+    """Run parse over csv_files in a thread pool, returning results in file order."""
+    with ThreadPoolExecutor(max_workers=min(_READ_WORKERS, len(csv_files))) as pool:
+        return list(pool.map(parse, csv_files))
+
+
+def _read_frame(csv_file: Path) -> pd.DataFrame:
+    """Read one CSV into a DataFrame holding only _USED_COLS.
+
+    Text columns stay plain strings (missing cells become ""), while the C parser turns
+    AGG_COLS into numbers directly; consolidate_frame coerces whatever it could not.
     """
-    all_rows = []
+    text_cols = GROUP_COLS + KEEP_COLS
+    return pd.read_csv(
+        csv_file,
+        encoding="utf-8-sig",
+        usecols=lambda c: c in _USED_COLS,
+        dtype=dict.fromkeys(text_cols, object),
+        keep_default_na=False,
+        na_values=dict.fromkeys(AGG_COLS, [""]),
+    )
+
+
+def _parse_frame(csv_file: Path) -> tuple[pd.DataFrame | None, str]:
+    """Read and validate one CSV for read_csv_frame; an empty file gives an empty frame.
+
+    Returns (frame, message) with frame None when the file is skipped; the message is
+    printed by the caller so output stays in file order.
+    """
+    try:
+        df = _read_frame(csv_file)
+    except pd.errors.EmptyDataError:
+        return pd.DataFrame(), f"Read 0 rows from {csv_file.name}"
+    except Exception as e:
+        return None, f"Error reading {csv_file.name}: {e}"
+
+    # usecols hides whether the file had data rows, so any header is validated
+    missing = [c for c in GROUP_COLS + AGG_COLS if c not in df]
+    if missing:
+        return None, f"Skipping {csv_file.name}: missing columns {missing}"
+
+    return df, f"Read {len(df)} rows from {csv_file.name}"
+
+
+def read_csv_frame(directory: Path) -> tuple[pd.DataFrame | None, list[Path]]:
+    """Read all CSV files in directory (not subdirectories) into one DataFrame.
+
+    Files are read in name order and keep only the columns consolidation uses; files
+    that cannot be read or lack required columns are reported and skipped. Returns
+    tuple of (frame, processed_files), with frame None when no rows were read.
+    """
+    frames = []
     processed_files = []
-    csv_files = list(directory.glob("*.csv"))
+    csv_files = sorted(directory.glob("*.csv"))
 
     if not csv_files:
         print(f"No CSV files found in {directory}")
-        return all_rows, processed_files
+        return None, processed_files
 
     print(f"Found {len(csv_files)} CSV files in {directory}")
 
-    for csv_file in csv_files:
-        try:
-            with open(csv_file, "r", encoding="utf-8-sig") as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-
-                # Validate required columns exist
-                if rows:
-                    missing = [c for c in GROUP_COLS + AGG_COLS if c not in rows[0]]
-                    if missing:
-                        print(f"  Skipping {csv_file.name}: missing columns {missing}")
-                        continue
-
-                all_rows.extend(rows)
-                processed_files.append(csv_file)
-                print(f"  Read {len(rows)} rows from {csv_file.name}")
-        except Exception as e:
-            print(f"  Error reading {csv_file.name}: {e}")
-
-    return all_rows, processed_files
-
-
-def consolidate_rows(rows: list[dict]) -> list[dict]:
-    """Consolidate rows by grouping columns and aggregating values."""
-    groups = {}
-
-    for row in rows:
-        # Build group key
-        key_parts = []
-        for col in GROUP_COLS:
-            val = row.get(col, "").strip()
-            key_parts.append(val)
-        key = tuple(key_parts)
-
-        if key not in groups:
-            # Initialize group with first row data
-            groups[key] = {col: row.get(col, "").strip() for col in GROUP_COLS}
-            for col in KEEP_COLS:
-                groups[key][col] = row.get(col, "").strip()
-            for col in AGG_COLS:
-                groups[key][col] = 0.0
-
-        # Aggregate numeric columns
-        for col in AGG_COLS:
-            try:
-                val = float(row.get(col, 0) or 0)
-                groups[key][col] += val
-            except (ValueError, TypeError):
-                pass
-
-    # Convert to list and add Position column
-    result = []
-    for data in groups.values():
-        data["Position"] = determine_position(
-            data.get("Buy/Sell", ""), data.get("Open/CloseIndicator", "")
-        )
-        result.append(data)
-
-    # Sort by underlying, date, symbol
-    result.sort(
-        key=lambda x: (
-            x.get("UnderlyingSymbol", ""),
-            x.get("TradeDate", ""),
-            x.get("Symbol", ""),
-        )
+    for csv_file, (df, message) in zip(csv_files, _map_files(_parse_frame, csv_files)):
+        print(f"  {message}")
+        if df is not None:
+            if len(df):
+                frames.append(df)
+            processed_files.append(csv_file)
+
+    if not frames:
+        return None, processed_files
+    return pd.concat(frames, ignore_index=True), processed_files
+
+
+def read_csv_files(directory: Path) -> tuple[list[dict], list[Path]]:
+    """read_csv_frame as row dicts, for callers that want records.
+
+    Returns tuple of (rows, processed_files).
+    """
+    df, processed_files = read_csv_frame(directory)
+    if df is None:
+        return [], processed_files
+    return df.to_dict("records"), processed_files
+
+
+def consolidate_frame(df: pd.DataFrame) -> list[dict]:
+    """Consolidate trades by grouping columns and aggregating values.
+
+    Text cells are stripped, and numeric cells float() would reject count as 0.0.
+    Returns one dict per group with a Position column, sorted by underlying, date
+    and symbol.
+    """
+    df = df.reindex(columns=list(_USED_COLS))
+    for col in GROUP_COLS + KEEP_COLS:
+        df[col] = df[col].fillna("").map(str.strip)
+    for col in AGG_COLS:
+        if df[col].dtype.kind != "f":
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype(float)
+    df[list(AGG_COLS)] = df[list(AGG_COLS)].fillna(0.0)
+
+    agg = {**dict.fromkeys(KEEP_COLS, "first"), **dict.fromkeys(AGG_COLS, "sum")}
+    grouped = df.groupby(list(GROUP_COLS), sort=False, as_index=False).agg(agg)
+
+    # determine_position over the whole column at once
+    buy_sell = grouped["Buy/Sell"].str.upper().to_numpy()
+    open_close = grouped["Open/CloseIndicator"].str.upper().to_numpy()
+    opening = open_close == "O"
+    grouped["Position"] = np.select(
+        [opening & (buy_sell == "SELL"), opening, buy_sell == "BUY"],
+        ["SHORT", "LONG", "CLOSE_SHORT"],
+        default="CLOSE_LONG",
     )
 
-    return result
+    # Sort by underlying, date, symbol; stable, so ties keep first-seen group order
+    grouped = grouped.sort_values(list(_SORT_COLS), kind="stable")
+
+    columns = list(grouped.columns)
+    return [dict(zip(columns, vals)) for vals in zip(*(grouped[c].tolist() for c in columns))]
+
+
+def consolidate_rows(rows: Iterable[dict]) -> list[dict]:
+    """consolidate_frame over row dicts (e.g. from csv.DictReader or read_csv_files)."""
+    return consolidate_frame(pd.DataFrame.from_records(list(rows), columns=list(_USED_COLS)))
 
 
-async def fetch_unrealized_pnl(port: int = None) -> tuple[dict[str, float], str | None]:
+async def fetch_unrealized_pnl(
+    port: int = None, cache_ttl: float = PNL_TTL
+) -> tuple[dict[str, float], str | None]:
     """Fetch unrealized P&L by underlying symbol from IB portfolio.
 
-    If port is None, tries both 7496 (live) and 7497 (paper) ports.
+    If port is None, tries both 7496 (live) and 7497 (paper) ports. A result fetched
+    by this process less than cache_ttl seconds ago is reused without connecting;
+    pass cache_ttl=0 to force a fresh fetch.
 
     Returns tuple of (unrealized_pnl_by_symbol, account_id).
     """
-    try:
-        from trading_skills.broker.connection import (
-            CLIENT_IDS,
-            fetch_positions,
-            ib_connection,
-        )
-    except ImportError:
+    if not _IB_AVAILABLE:
         print("Warning: ib_async not available, skipping unrealized P&L")
         return {}, None
 
+    hit = _pnl_cache.get(port)
+    if hit and time.monotonic() - hit[0] < cache_ttl:
+        return hit[1]
+    pnl = await _unrealized_pnl(port)
+    if pnl is None:
+        return {}, None
+    _pnl_cache[port] = (time.monotonic(), pnl)
+    return pnl
+
+
+async def _unrealized_pnl(port: int | None) -> tuple[dict[str, float], str | None] | None:
+    """Connect to IB and compute unrealized P&L; None when no port accepts a connection."""
+
     # Determine ports to try
     if port:
         ports_to_try = [port]
     else:
         ports_to_try = [7496, 7497]  # Try live first, then paper
 
-    ib_ctx = None
-    connected_port = None
-    for try_port in ports_to_try:
-        try:
-            print(f"Trying to connect to IB on port {try_port}...")
-            ib_ctx = ib_connection(try_port, CLIENT_IDS["consolidate"])
-            ib = await ib_ctx.__aenter__()
-            connected_port = try_port
-            print(f"Connected to IB on port {try_port}")
-            break
-        except ConnectionError as e:
-            print(f"  Port {try_port} not available: {e}")
-            continue
-
-    if not connected_port:
-        print("Warning: Could not connect to IB on any port")
-        return {}, None
-
     unrealized_by_symbol = {}
     account_id = None
 
-    try:
+    # The stack owns whichever connection succeeds and closes it on any exit
+    async with AsyncExitStack() as stack:
+        ib = None
+        for try_port in ports_to_try:
+            try:
+                print(f"Trying to connect to IB on port {try_port}...")
+                ib = await stack.enter_async_context(
+                    ib_connection(try_port, CLIENT_IDS["consolidate"])
+                )
+                print(f"Connected to IB on port {try_port}")
+                break
+            except ConnectionError as e:
+                print(f"  Port {try_port} not available: {e}")
+                continue
+
+        if ib is None:
+            print("Warning: Could not connect to IB on any port")
+            return None
+
         # Get account ID
         managed_accounts = ib.managedAccounts()
         if managed_accounts:
@@ -184,52 +269,59 @@ async def fetch_unrealized_pnl(port: int = None) -> tuple[dict[str, float], str
         all_positions = await fetch_positions(ib)
         print(f"Found {len(all_positions)} positions in portfolio")
 
-        # Separate options from other positions
-        option_positions = [p for p in all_positions if p.contract.secType == "OPT"]
+        # IB's account updates already carry unrealized P&L for the positions they
+        # cover; only options missing there (or without a price) need tickers.
+        portfolio_pnl = {}
+        for item in ib.portfolio():
+            if (
+                item.contract.secType == "OPT"
+                and item.marketPrice > 0
+                and math.isfinite(item.unrealizedPNL)
+            ):
+                portfolio_pnl[(item.account, item.contract.conId)] = item.unrealizedPNL
+
+        # One pass over positions: option contracts to price plus the P&L inputs
+        option_contracts = []
+        option_entries = []
+        for pos in all_positions:
+            c = pos.contract
+            if c.secType != "OPT":
+                continue
+            pnl = portfolio_pnl.get((pos.account, c.conId))
+            if pnl is not None:
+                unrealized_by_symbol[c.symbol] = unrealized_by_symbol.get(c.symbol, 0) + pnl
+                continue
+            option_contracts.append(c)
+            key = (c.symbol, c.strike, c.lastTradeDateOrContractMonth, c.right)
+            multiplier = int(c.multiplier) if c.multiplier else 100
+            option_entries.append((key, multiplier, pos.position, pos.avgCost))
 
         # Fetch option prices
         option_prices = {}
-        if option_positions:
-            option_contracts = [p.contract for p in option_positions]
-            try:
-                qualified_opts = await asyncio.wait_for(
-                    ib.qualifyContractsAsync(*option_contracts), timeout=15.0
-                )
-                if qualified_opts:
-                    opt_tickers = await asyncio.wait_for(
-                        ib.reqTickersAsync(*qualified_opts), timeout=15.0
-                    )
-                    for ticker in opt_tickers or []:
-                        c = ticker.contract
-                        key = (c.symbol, c.strike, c.lastTradeDateOrContractMonth, c.right)
-                        price = ticker.marketPrice()
-                        if price and price > 0:
-                            option_prices[key] = price
-            except asyncio.TimeoutError:
-                print("Warning: Timeout fetching option prices")
+        if option_contracts:
+            opt_tickers = await req_tickers_batched(
+                ib, option_contracts, timeout=15.0, qualify=True
+            )
+            if not opt_tickers:
+                print("Warning: Could not fetch option prices")
+            for ticker in opt_tickers:
+                c = ticker.contract
+                key = (c.symbol, c.strike, c.lastTradeDateOrContractMonth, c.right)
+                price = ticker.marketPrice()
+                if price and price > 0:
+                    option_prices[key] = price
 
         # Calculate unrealized P&L by underlying
-        for pos in option_positions:
-            contract = pos.contract
-            symbol = contract.symbol
-            multiplier = int(contract.multiplier) if contract.multiplier else 100
-            key = (
-                contract.symbol,
-                contract.strike,
-                contract.lastTradeDateOrContractMonth,
-                contract.right,
-            )
+        for key, multiplier, quantity, avg_cost in option_entries:
             market_price = option_prices.get(key)
 
             if market_price:
-                unrealized = (market_price - pos.avgCost / multiplier) * pos.position * multiplier
+                symbol = key[0]
+                unrealized = (market_price - avg_cost / multiplier) * quantity * multiplier
                 unrealized_by_symbol[symbol] = unrealized_by_symbol.get(symbol, 0) + unrealized
 
         # Round values
         unrealized_by_symbol = {k: round(v, 2) for k, v in unrealized_by_symbol.items()}
         print(f"Calculated unrealized P&L for {len(unrealized_by_symbol)} symbols")
 
-    finally:
-        await ib_ctx.__aexit__(None, None, None)
-
     return unrealized_by_symbol, account_id
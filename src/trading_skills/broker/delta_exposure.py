@@ -1,14 +1,38 @@
 # ABOUTME: Calculates delta-adjusted notional exposure for IBKR portfolio.
 # ABOUTME: Uses Black-Scholes for option deltas, reports by account and underlying.
 
-import asyncio
-from datetime import date, datetime
+from datetime import date
 
+import numpy as np
 from ib_async import Stock
 
-from trading_skills.black_scholes import black_scholes_delta, estimate_iv
-from trading_skills.broker.connection import CLIENT_IDS, fetch_positions, ib_connection
-from trading_skills.utils import fetch_with_timeout
+from trading_skills.black_scholes import black_scholes_delta_vec, estimate_iv_vec
+from trading_skills.broker.connection import (
+    CLIENT_IDS,
+    fetch_positions,
+    ib_connection,
+    req_tickers_batched,
+)
+
+# Rough futures spot by symbol for FOP deltas; other symbols fall back to the strike
+_FUTURES_SPOT_ESTIMATES = {"NQ": 21500, "ES": 5000}
+
+
+def _option_arrays(positions: list, today: date) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Strike, years to expiry (floored at 0.001) and is-call arrays for option positions."""
+    n = len(positions)
+    contracts = [p.contract for p in positions]
+    strikes = np.fromiter((c.strike for c in contracts), float, n)
+    # Positions share few expiries, so each distinct YYYYMMDD is sliced apart only once
+    days_by_expiry = {
+        s: (date(int(s[:4]), int(s[4:6]), int(s[6:8])) - today).days
+        for s in {c.lastTradeDateOrContractMonth for c in contracts}
+    }
+    days = np.fromiter(
+        (days_by_expiry[c.lastTradeDateOrContractMonth] for c in contracts), float, n
+    )
+    is_call = np.fromiter((c.right == "C" for c in contracts), bool, n)
+    return strikes, np.maximum(days / 365.0, 0.001), is_call
 
 
 async def get_delta_exposure(port: int = 7496):
@@ -27,9 +51,9 @@ async def _get_delta_exposure(port: int):
     async with ib_connection(port, CLIENT_IDS["delta_exposure"]) as ib:
         managed = ib.managedAccounts()
 
-        all_positions = []
-        for acct in managed:
-            all_positions.extend(await fetch_positions(ib, account=acct))
+        # One request covers every managed account
+        wanted = set(managed)
+        all_positions = [p for p in await fetch_positions(ib) if p.account in wanted]
 
         # Separate by type
         option_positions = [p for p in all_positions if p.contract.secType == "OPT"]
@@ -50,56 +74,39 @@ async def _get_delta_exposure(port: int):
                     pass
 
             if stock_contracts:
-                qualified = await fetch_with_timeout(
-                    ib.qualifyContractsAsync(*stock_contracts), timeout=30.0, default=[]
-                )
-                if qualified:
-                    for i in range(0, len(qualified), 20):
-                        batch = qualified[i : i + 20]
-                        tickers = await fetch_with_timeout(
-                            ib.reqTickersAsync(*batch), timeout=30.0, default=[]
-                        )
-                        for ticker in tickers or []:
-                            price = ticker.marketPrice()
-                            if price and price > 0:
-                                spot_prices[ticker.contract.symbol] = price
-                        await asyncio.sleep(0.5)
+                tickers = await req_tickers_batched(ib, stock_contracts, timeout=30.0, qualify=True)
+                for ticker in tickers:
+                    price = ticker.marketPrice()
+                    if price and price > 0:
+                        spot_prices[ticker.contract.symbol] = price
 
         today = date.today()
         results = []
 
-        # Process equity options
-        for pos in option_positions:
+        # Process equity options; deltas for every position come from one vector call
+        spots = [
+            spot_prices.get(p.contract.symbol) or p.contract.strike * 0.95  # Fallback estimate
+            for p in option_positions
+        ]
+        strikes, years, is_call = _option_arrays(option_positions, today)
+        ivs = estimate_iv_vec(spots, strikes, is_call)
+        deltas = black_scholes_delta_vec(spots, strikes, years, 0.05, ivs, is_call)
+
+        for pos, spot, delta in zip(option_positions, spots, deltas.tolist()):
             c = pos.contract
-            symbol = c.symbol
-            spot = spot_prices.get(symbol)
-            if not spot:
-                spot = c.strike * 0.95  # Fallback estimate
-
-            strike = c.strike
-            expiry_str = c.lastTradeDateOrContractMonth
-            expiry_date = datetime.strptime(expiry_str, "%Y%m%d").date()
-            dte = (expiry_date - today).days
-            dte_years = max(dte / 365.0, 0.001)
-
-            is_call = c.right == "C"
             multiplier = int(c.multiplier) if c.multiplier else 100
             qty = pos.position
 
-            option_type = "call" if is_call else "put"
-            iv = estimate_iv(spot, strike, dte_years, option_type)
-            delta = black_scholes_delta(spot, strike, dte_years, 0.05, iv, option_type)
-
             delta_notional = delta * spot * qty * multiplier
             raw_notional = spot * qty * multiplier
 
             results.append(
                 {
                     "account": pos.account,
-                    "symbol": symbol,
+                    "symbol": c.symbol,
                     "sec_type": "OPT",
-                    "strike": strike,
-                    "expiry": expiry_str,
+                    "strike": c.strike,
+                    "expiry": c.lastTradeDateOrContractMonth,
                     "right": c.right,
                     "qty": qty,
                     "spot": round(spot, 2),
@@ -110,37 +117,29 @@ async def _get_delta_exposure(port: int):
                 }
             )
 
-        # Process futures options (FOP)
-        for pos in fut_opt_positions:
+        # Process futures options (FOP); spot estimated from symbol, lower IV for index futures
+        fut_spots = [
+            _FUTURES_SPOT_ESTIMATES.get(p.contract.symbol, p.contract.strike)
+            for p in fut_opt_positions
+        ]
+        strikes, years, is_call = _option_arrays(fut_opt_positions, today)
+        deltas = black_scholes_delta_vec(fut_spots, strikes, years, 0.05, 0.20, is_call)
+
+        for pos, spot, delta in zip(fut_opt_positions, fut_spots, deltas.tolist()):
             c = pos.contract
-            symbol = c.symbol
-            strike = c.strike
-            expiry_str = c.lastTradeDateOrContractMonth
-            expiry_date = datetime.strptime(expiry_str, "%Y%m%d").date()
-            dte = (expiry_date - today).days
-            dte_years = max(dte / 365.0, 0.001)
-
-            is_call = c.right == "C"
             multiplier = int(c.multiplier) if c.multiplier else 20
             qty = pos.position
 
-            # Estimate futures spot from symbol
-            spot = 21500 if symbol == "NQ" else 5000 if symbol == "ES" else strike
-
-            iv = 0.20  # Lower IV for index futures
-            option_type = "call" if is_call else "put"
-            delta = black_scholes_delta(spot, strike, dte_years, 0.05, iv, option_type)
-
             delta_notional = delta * spot * qty * multiplier
             raw_notional = spot * qty * multiplier
 
             results.append(
                 {
                     "account": pos.account,
-                    "symbol": symbol,
+                    "symbol": c.symbol,
                     "sec_type": "FOP",
-                    "strike": strike,
-                    "expiry": expiry_str,
+                    "strike": c.strike,
+                    "expiry": c.lastTradeDateOrContractMonth,
                     "right": c.right,
                     "qty": qty,
                     "spot": spot,
@@ -197,31 +196,23 @@ async def _get_delta_exposure(port: int):
                 }
             )
 
-        # Calculate summaries
-        long_delta_notional = sum(p["delta_notional"] for p in results if p["delta_notional"] > 0)
-        short_delta_notional = sum(p["delta_notional"] for p in results if p["delta_notional"] < 0)
-
-        # By account
+        # Totals plus by-account and by-underlying [long, short] sums in one pass
+        long_delta_notional = short_delta_notional = 0
         account_summary = {}
-        for p in results:
-            acct = p["account"]
-            if acct not in account_summary:
-                account_summary[acct] = {"long": 0, "short": 0}
-            if p["delta_notional"] > 0:
-                account_summary[acct]["long"] += p["delta_notional"]
-            else:
-                account_summary[acct]["short"] += p["delta_notional"]
-
-        # By underlying
         underlying_summary = {}
         for p in results:
-            sym = p["symbol"]
-            if sym not in underlying_summary:
-                underlying_summary[sym] = {"long": 0, "short": 0}
-            if p["delta_notional"] > 0:
-                underlying_summary[sym]["long"] += p["delta_notional"]
+            dn = p["delta_notional"]
+            acct = account_summary.setdefault(p["account"], [0, 0])
+            und = underlying_summary.setdefault(p["symbol"], [0, 0])
+            if dn > 0:
+                long_delta_notional += dn
+                acct[0] += dn
+                und[0] += dn
             else:
-                underlying_summary[sym]["short"] += p["delta_notional"]
+                if dn < 0:
+                    short_delta_notional += dn
+                acct[1] += dn
+                und[1] += dn
 
         return {
             "connected": True,
@@ -233,16 +224,16 @@ async def _get_delta_exposure(port: int):
                 "total_short_delta_notional": round(short_delta_notional, 2),
                 "net_delta_notional": round(long_delta_notional + short_delta_notional, 2),
                 "by_account": {
-                    k: {"long": round(v["long"], 2), "short": round(v["short"], 2)}
-                    for k, v in account_summary.items()
+                    k: {"long": round(long, 2), "short": round(short, 2)}
+                    for k, (long, short) in account_summary.items()
                 },
                 "by_underlying": {
                     k: {
-                        "long": round(v["long"], 2),
-                        "short": round(v["short"], 2),
-                        "net": round(v["long"] + v["short"], 2),
+                        "long": round(long, 2),
+                        "short": round(short, 2),
+                        "net": round(long + short, 2),
                     }
-                    for k, v in underlying_summary.items()
+                    for k, (long, short) in underlying_summary.items()
                 },
             },
         }
@@ -4,16 +4,31 @@
 import asyncio
 import logging
 import math
+import time
+from datetime import date
 
 from ib_async import IB, Contract, Option, Stock
 
-from trading_skills.broker.connection import CLIENT_IDS, best_option_chain, ib_connection
+from trading_skills.broker.connection import (
+    CLIENT_IDS,
+    MAX_CONCURRENT_QUOTE_BATCHES,
+    best_option_chain,
+    ib_connection,
+    req_tickers_batched,
+)
 from trading_skills.broker.futures import (
     detect_future_exchange,
     front_future,
     resolve_fop_contracts,
 )
 
+# Listed expirations only change when new series are added, so successful
+# get_expiries results are reused for EXPIRIES_TTL seconds, keyed by (symbol,
+# sec_type, port, trading date) so live and paper sessions and a new day never share.
+# Entries hold the expiries as a tuple; each hit hands out a fresh list.
+EXPIRIES_TTL = 3600
+_expiries_cache: dict[tuple[str, str | None, int, date], tuple[float, dict]] = {}
+
 
 def _clean(x, ndigits=4):
     """Round a float, mapping None/NaN to None."""
@@ -95,12 +110,18 @@ async def _resolve_underlying(ib: IB, symbol: str, sec_type: str | None) -> tupl
 async def _sec_def_params(ib: IB, symbol: str, asset_type: str, contract: Contract, exchange):
     """reqSecDefOptParams for an already-qualified underlying."""
     if asset_type == "future":
-        return await ib.reqSecDefOptParamsAsync(symbol.upper(), exchange, "FUT", contract.conId)
+        return await ib.reqSecDefOptParamsAsync(symbol, exchange, "FUT", contract.conId)
     return await ib.reqSecDefOptParamsAsync(symbol, "", "STK", contract.conId)
 
 
 async def get_expiries(symbol: str, port: int = 7496, sec_type: str | None = None) -> dict:
     """Get available option expiration dates from IB (equity/ETF or futures)."""
+    symbol = symbol.upper()
+    key = (symbol, sec_type, port, date.today())
+    entry = _expiries_cache.get(key)
+    if entry and time.monotonic() - entry[0] < EXPIRIES_TTL:
+        return {**entry[1], "expiries": list(entry[1]["expiries"])}
+
     try:
         async with ib_connection(port, CLIENT_IDS["options_expiries"]) as ib:
             asset_type, contract, exchange = await _resolve_underlying(ib, symbol, sec_type)
@@ -112,13 +133,18 @@ async def get_expiries(symbol: str, port: int = 7496, sec_type: str | None = Non
                 return {"success": False, "error": f"No options found for {symbol}"}
 
             chain = best_option_chain(chains)
-            return {
+            result = {
                 "success": True,
-                "symbol": symbol.upper(),
+                "symbol": symbol,
                 "source": "ibkr",
                 "asset_type": asset_type,
                 "expiries": sorted(chain.expirations),
             }
+            _expiries_cache[key] = (
+                time.monotonic(),
+                {**result, "expiries": tuple(result["expiries"])},
+            )
+            return result
     except ConnectionError as e:
         return {"success": False, "error": str(e)}
 
@@ -137,6 +163,7 @@ async def get_option_chain(
     symbol: str, expiry: str, port: int = 7496, sec_type: str | None = None
 ) -> dict:
     """Fetch option chain for a specific expiration date from IB (equity/ETF or futures)."""
+    symbol = symbol.upper()
     try:
         async with ib_connection(port, CLIENT_IDS["options_chain"]) as ib:
             # Delayed-frozen data (type 4) returns last known values outside market hours.
@@ -165,6 +192,7 @@ async def get_option_chain(
             else:
                 strikes = all_strikes
 
+            sem = asyncio.Semaphore(MAX_CONCURRENT_QUOTE_BATCHES)
             ib_logger = logging.getLogger("ib_async")
             prev_level = ib_logger.level
             ib_logger.setLevel(logging.CRITICAL)
@@ -172,23 +200,23 @@ async def get_option_chain(
                 if futures:
                     calls, puts = await asyncio.gather(
                         _fetch_fop_quotes(
-                            ib, symbol, expiry, strikes, "C", underlying_price, exchange
+                            ib, symbol, expiry, strikes, "C", underlying_price, exchange, sem
                         ),
                         _fetch_fop_quotes(
-                            ib, symbol, expiry, strikes, "P", underlying_price, exchange
+                            ib, symbol, expiry, strikes, "P", underlying_price, exchange, sem
                         ),
                     )
                 else:
                     calls, puts = await asyncio.gather(
-                        _fetch_quotes(ib, symbol, expiry, strikes, "C", underlying_price),
-                        _fetch_quotes(ib, symbol, expiry, strikes, "P", underlying_price),
+                        _fetch_quotes(ib, symbol, expiry, strikes, "C", underlying_price, sem),
+                        _fetch_quotes(ib, symbol, expiry, strikes, "P", underlying_price, sem),
                     )
             finally:
                 ib_logger.setLevel(prev_level)
 
             return {
                 "success": True,
-                "symbol": symbol.upper(),
+                "symbol": symbol,
                 "source": "ibkr",
                 "asset_type": asset_type,
                 "expiry": expiry,
@@ -234,7 +262,13 @@ def _quote_row(t, right: str, underlying_price: float, include_multiplier: bool)
 
 
 async def _fetch_quotes(
-    ib: IB, symbol: str, expiry: str, strikes: list, right: str, underlying_price: float
+    ib: IB,
+    symbol: str,
+    expiry: str,
+    strikes: list,
+    right: str,
+    underlying_price: float,
+    sem: asyncio.Semaphore | None = None,
 ) -> list:
     """Fetch equity/ETF option quotes for all strikes at given expiry and right (C/P)."""
     contracts = [Option(symbol, expiry, strike, right, "SMART") for strike in strikes]
@@ -248,9 +282,8 @@ async def _fetch_quotes(
     if not qualified:
         return []
 
-    try:
-        tickers = await asyncio.wait_for(ib.reqTickersAsync(*qualified), timeout=30)
-    except asyncio.TimeoutError:
+    tickers = await req_tickers_batched(ib, qualified, sem)
+    if not tickers:
         return []
 
     await asyncio.sleep(1)  # IB streams data asynchronously
@@ -271,15 +304,15 @@ async def _fetch_fop_quotes(
     right: str,
     underlying_price: float,
     exchange: str,
+    sem: asyncio.Semaphore | None = None,
 ) -> list:
     """Fetch futures-option (FOP) quotes + model Greeks for all strikes at expiry/right."""
     qualified = await resolve_fop_contracts(ib, symbol, expiry, strikes, right, exchange)
     if not qualified:
         return []
 
-    try:
-        tickers = await asyncio.wait_for(ib.reqTickersAsync(*qualified), timeout=30)
-    except asyncio.TimeoutError:
+    tickers = await req_tickers_batched(ib, qualified, sem)
+    if not tickers:
         return []
 
     await asyncio.sleep(1)  # IB streams data asynchronously
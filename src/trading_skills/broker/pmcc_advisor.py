@@ -673,7 +673,12 @@ async def _read_option_quotes(ib, contracts: list, expiry: str) -> list[dict]:
 
 
 async def _fetch_option_quotes_batch(
-    ib, symbol: str, expiry: str, strikes: list[float], right: str, sem=None
+    ib,
+    symbol: str,
+    expiry: str,
+    strikes: list[float],
+    right: str,
+    sem: asyncio.Semaphore | None = None,
 ) -> list[dict]:
     """Fetch option quotes for multiple strikes at one expiry.
 
@@ -809,7 +814,6 @@ async def get_pmcc_data(
     try:
         async with ib_connection(port, CLIENT_IDS["pmcc_advisor"]) as ib:
             ib.reqMarketDataType(4)
-            await asyncio.sleep(2)
 
             managed = ib.managedAccounts()
             if account and account not in managed:
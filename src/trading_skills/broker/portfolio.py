@@ -1,6 +1,8 @@
 # ABOUTME: Fetches portfolio positions from Interactive Brokers.
 # ABOUTME: Requires TWS or IB Gateway running locally.
 
+import asyncio
+
 from trading_skills.broker.connection import (
     CLIENT_IDS,
     fetch_positions,
@@ -10,6 +12,28 @@ from trading_skills.broker.connection import (
 from trading_skills.utils import fetch_with_timeout
 
 
+async def _fetch_option_prices(ib, option_positions: list) -> dict:
+    """Market prices for option positions keyed by (symbol, strike, expiry, right)."""
+    option_prices = {}
+    if not option_positions:
+        return option_prices
+    option_contracts = [p.contract for p in option_positions]
+    qualified_opts = await fetch_with_timeout(
+        ib.qualifyContractsAsync(*option_contracts), timeout=15.0, default=[]
+    )
+    if qualified_opts:
+        opt_tickers = await fetch_with_timeout(
+            ib.reqTickersAsync(*qualified_opts), timeout=15.0, default=[]
+        )
+        for ticker in opt_tickers or []:
+            c = ticker.contract
+            key = (c.symbol, c.strike, c.lastTradeDateOrContractMonth, c.right)
+            price = ticker.marketPrice()
+            if price and price > 0:
+                option_prices[key] = round(price, 2)
+    return option_prices
+
+
 async def get_portfolio(port: int = 7496, account: str = None, all_accounts: bool = False) -> dict:
     """Fetch portfolio positions from IB."""
     try:
@@ -29,38 +53,23 @@ async def get_portfolio(port: int = 7496, account: str = None, all_accounts: boo
             else:
                 accounts_to_fetch = [managed[0]] if managed else []
 
-            # Fetch raw positions
-            all_positions = []
-            for acct in accounts_to_fetch:
-                all_positions.extend(await fetch_positions(ib, account=acct))
+            # Fetch raw positions in one request, then keep the selected accounts
+            wanted = set(accounts_to_fetch)
+            all_positions = [p for p in await fetch_positions(ib) if p.account in wanted]
 
             # Separate options and other positions
             option_positions = [p for p in all_positions if p.contract.secType == "OPT"]
             other_positions = [p for p in all_positions if p.contract.secType != "OPT"]
 
-            # Fetch spot prices for underlyings
+            # Spot prices (a streaming window) and option tickers are independent
+            # round trips, so run them concurrently
             underlying_symbols = {p.contract.symbol for p in option_positions}
-            spot_prices = await fetch_spot_prices(ib, list(underlying_symbols))
+            spot_prices, option_prices = await asyncio.gather(
+                fetch_spot_prices(ib, list(underlying_symbols)),
+                _fetch_option_prices(ib, option_positions),
+            )
             spot_prices = {k: round(v, 2) for k, v in spot_prices.items()}
 
-            # Fetch market prices for option contracts (module-specific)
-            option_prices = {}
-            if option_positions:
-                option_contracts = [p.contract for p in option_positions]
-                qualified_opts = await fetch_with_timeout(
-                    ib.qualifyContractsAsync(*option_contracts), timeout=15.0, default=[]
-                )
-                if qualified_opts:
-                    opt_tickers = await fetch_with_timeout(
-                        ib.reqTickersAsync(*qualified_opts), timeout=15.0, default=[]
-                    )
-                    for ticker in opt_tickers or []:
-                        c = ticker.contract
-                        key = (c.symbol, c.strike, c.lastTradeDateOrContractMonth, c.right)
-                        price = ticker.marketPrice()
-                        if price and price > 0:
-                            option_prices[key] = round(price, 2)
-
             pos_list = []
 
             # Process non-option positions
@@ -1,6 +1,7 @@
 # ABOUTME: Analyzes IB portfolio positions with earnings and risk assessment.
 # ABOUTME: Groups positions into spreads, categorizes by urgency/risk.
 
+import asyncio
 import sys
 from collections import defaultdict
 from datetime import datetime
@@ -307,9 +308,13 @@ async def get_portfolio_data(port: int, account: str = None) -> dict:
                         symbols.add(pos["symbol"])
 
             symbols = symbols - futures_symbols
-            prices = await fetch_spot_prices(ib, list(symbols))
             # Futures underlyings are priced via IB continuous futures (yfinance can't).
-            prices.update(await fetch_futures_spot_prices(ib, list(futures_symbols)))
+            # Both wait out a streaming window, so run them concurrently.
+            prices, futures_prices = await asyncio.gather(
+                fetch_spot_prices(ib, list(symbols)),
+                fetch_futures_spot_prices(ib, list(futures_symbols)),
+            )
+            prices.update(futures_prices)
             # Round prices for display
             prices = {k: round(v, 2) for k, v in prices.items()}
 
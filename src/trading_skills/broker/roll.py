@@ -4,13 +4,21 @@
 import asyncio
 import math
 import sys
-from datetime import datetime
+import time
+from datetime import date, datetime
 from math import erf, log, sqrt
 
+import numpy as np
 import yfinance as yf
 from ib_async import IB, Option, Stock
 
-from trading_skills.broker.connection import CLIENT_IDS, best_option_chain, ib_connection
+from trading_skills.broker.connection import (
+    CLIENT_IDS,
+    MAX_CONCURRENT_QUOTE_BATCHES,
+    best_option_chain,
+    ib_connection,
+    req_tickers_batched,
+)
 from trading_skills.broker.futures import (
     detect_future_exchange,
     front_future,
@@ -21,6 +29,12 @@ from trading_skills.utils import days_to_expiry, is_trading_now
 
 _DEFAULT_IV = 0.30  # fallback when IV cannot be determined from quotes
 
+# Expirations/strikes change at most once a day, so reqSecDefOptParams results are
+# reused for CHAIN_PARAMS_TTL seconds, keyed by (symbol, exchange, port, trading date).
+# Entries hold tuples; each hit hands out fresh lists.
+CHAIN_PARAMS_TTL = 900
+_chain_params_cache: dict[tuple[str, str | None, int | None, date], tuple[float, dict]] = {}
+
 
 def _data_delay_label(price_stale: bool, options_stale: bool, live: bool) -> str:
     """Compute the data_delay string based on price source and market session."""
@@ -117,7 +131,13 @@ def _select_roll_strikes(
         lo, hi = current_strike - buffer, current_strike + half_band
     else:
         lo, hi = current_strike - half_band, current_strike + buffer
-    return sorted(s for s in all_strikes if lo <= s <= hi)
+    return _strikes_in_band(all_strikes, lo, hi)
+
+
+def _strikes_in_band(all_strikes: list, lo: float, hi: float) -> list:
+    """Return the sorted strikes in [lo, hi] using a vectorized mask (chains can be 1000+ wide)."""
+    arr = np.asarray(all_strikes, dtype=float)
+    return np.sort(arr[(arr >= lo) & (arr <= hi)]).tolist()
 
 
 async def get_current_position(ib: IB, symbol: str, account: str = None) -> dict | None:
@@ -276,8 +296,26 @@ async def get_underlying_price(
     return price, stale
 
 
-async def get_option_chain_params(ib: IB, symbol: str, exchange: str | None = None) -> dict:
-    """Get available expirations and strikes for symbol."""
+async def get_option_chain_params(
+    ib: IB, symbol: str, exchange: str | None = None, port: int | None = None
+) -> dict:
+    """Get available expirations and strikes for symbol (memoized per session).
+
+    port is the IB port ib is connected to; it only keys the cache.
+    """
+    key = (symbol, exchange, port, date.today())
+    entry = _chain_params_cache.get(key)
+    if entry and time.monotonic() - entry[0] < CHAIN_PARAMS_TTL:
+        return {k: list(v) for k, v in entry[1].items()}
+
+    params = await _fetch_option_chain_params(ib, symbol, exchange)
+    if params["expirations"]:
+        _chain_params_cache[key] = (time.monotonic(), {k: tuple(v) for k, v in params.items()})
+    return params
+
+
+async def _fetch_option_chain_params(ib: IB, symbol: str, exchange: str | None) -> dict:
+    """Query IB for the expirations and strikes of symbol's best option chain."""
     if exchange:
         fut = await front_future(ib, symbol, exchange)
         if not fut:
@@ -340,9 +378,19 @@ def _build_quote(t) -> dict:
 
 
 async def get_option_quotes(
-    ib: IB, symbol: str, expiry: str, strikes: list, right: str, exchange: str | None = None
+    ib: IB,
+    symbol: str,
+    expiry: str,
+    strikes: list,
+    right: str,
+    exchange: str | None = None,
+    sem: asyncio.Semaphore | None = None,
 ) -> list:
-    """Get quotes for options at given strikes and expiry."""
+    """Get quotes for options at given strikes and expiry.
+
+    ``sem`` is shared across concurrent calls so their ticker chunks stay within the
+    IB market-data line budget (see connection.req_tickers_batched).
+    """
     if exchange:
         qualified = await resolve_fop_contracts(ib, symbol, expiry, strikes, right, exchange)
         if not qualified:
@@ -357,11 +405,26 @@ async def get_option_quotes(
         if not qualified:
             return []
 
-    tickers = await asyncio.wait_for(ib.reqTickersAsync(*qualified), timeout=15)
+    tickers = await req_tickers_batched(ib, qualified, sem, timeout=15)
     results = [_build_quote(t) for t in tickers if t.contract is not None]
     return sorted(results, key=lambda x: x["strike"])
 
 
+async def _quotes_by_expiry(
+    ib: IB, symbol: str, expiries: list, strikes: list, right: str, exchange: str | None
+) -> dict:
+    """Fetch quotes for every expiry concurrently under one shared line budget.
+
+    ib_async already paces outgoing messages below IB's per-second limit; the binding
+    constraint is open market-data lines, so all expiries share a single semaphore.
+    """
+    sem = asyncio.Semaphore(MAX_CONCURRENT_QUOTE_BATCHES)
+    results = await asyncio.gather(
+        *(get_option_quotes(ib, symbol, exp, strikes, right, exchange, sem) for exp in expiries)
+    )
+    return dict(zip(expiries, results))
+
+
 def evaluate_short_candidates(
     quotes: list,
     underlying_price: float,
@@ -499,8 +562,11 @@ async def _find_roll(ib, symbol, current_position, chain_params, exchange, iv_mu
     # Fetch quotes for each target expiration
     roll_data = {}
     right = current_position["right"]
+    quotes_by_exp = await _quotes_by_expiry(
+        ib, symbol, future_exps, target_strikes, right, exchange
+    )
     for exp in future_exps:
-        quotes = await get_option_quotes(ib, symbol, exp, target_strikes, right, exchange)
+        quotes = quotes_by_exp[exp]
         # Exclude rolling into the exact same (expiry, strike) already held.
         if exp == current_exp:
             quotes = [q for q in quotes if q["strike"] != current_position["strike"]]
@@ -564,8 +630,11 @@ async def _find_spread(ib, symbol, long_option, right, chain_params, exchange):
 
     # Fetch quotes and evaluate candidates
     candidates_by_expiry = {}
+    quotes_by_exp = await _quotes_by_expiry(
+        ib, symbol, target_exps, target_strikes, right, exchange
+    )
     for exp in target_exps:
-        quotes = await get_option_quotes(ib, symbol, exp, target_strikes, right, exchange)
+        quotes = quotes_by_exp[exp]
         dte = days_to_expiry(exp)
         candidates = evaluate_short_candidates(quotes, underlying_price, right, dte)
         if candidates:
@@ -613,18 +682,18 @@ async def _find_new_short(
     half_band = _compute_half_band(underlying_price, _DEFAULT_IV, iv_multiplier, dte_ref)
     all_strikes = chain_params["strikes"]
     if right == "C":
-        target_strikes = sorted(
-            s for s in all_strikes if underlying_price <= s <= underlying_price + half_band
-        )
+        lo, hi = underlying_price, underlying_price + half_band
     else:
-        target_strikes = sorted(
-            s for s in all_strikes if underlying_price - half_band <= s <= underlying_price
-        )
+        lo, hi = underlying_price - half_band, underlying_price
+    target_strikes = _strikes_in_band(all_strikes, lo, hi)
 
     # Fetch quotes and evaluate candidates
     candidates_by_expiry = {}
+    quotes_by_exp = await _quotes_by_expiry(
+        ib, symbol, future_exps, target_strikes, right, exchange
+    )
     for exp in future_exps:
-        quotes = await get_option_quotes(ib, symbol, exp, target_strikes, right, exchange)
+        quotes = quotes_by_exp[exp]
         dte = days_to_expiry(exp)
         candidates = evaluate_short_candidates(quotes, underlying_price, right, dte)
         if candidates:
@@ -686,7 +755,7 @@ async def find_roll_candidates(
                 is_fop = (await detect_future_exchange(ib, symbol)) is not None
 
             exchange = await detect_future_exchange(ib, symbol) if is_fop else None
-            chain_params = await get_option_chain_params(ib, symbol, exchange)
+            chain_params = await get_option_chain_params(ib, symbol, exchange, port)
 
             # Explicit strike/expiry → roll mode
             if strike and expiry:
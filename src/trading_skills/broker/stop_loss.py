@@ -767,7 +767,6 @@ async def get_stop_loss_data(
         legs_set = parse_legs_spec(legs)
         async with ib_connection(port, CLIENT_IDS.get("stop_loss", 14), readonly=dry_run) as ib:
             ib.reqMarketDataType(4)
-            await asyncio.sleep(2)
 
             managed = ib.managedAccounts()
             if account and account not in managed:
@@ -441,7 +441,6 @@ async def get_trailing_stop_data(
     try:
         async with ib_connection(port, CLIENT_IDS.get("trailing_stop", 15), readonly=dry_run) as ib:
             ib.reqMarketDataType(4)
-            await asyncio.sleep(2)
 
             managed = ib.managedAccounts()
             if account and account not in managed:
@@ -0,0 +1,98 @@
+# ABOUTME: Opt-in file-backed JSON cache with per-function TTLs for slow market data lookups.
+# ABOUTME: Off unless TS_CACHE_DIR is set, so runs see live data by default.
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+# The cache is opt-in: set TS_CACHE_DIR to a directory to enable it. TS_NOCACHE=1
+# turns it back off without unsetting the directory.
+
+
+def cache_dir() -> Path | None:
+    """Directory holding cache entries, or None when TS_CACHE_DIR is unset.
+
+    Read from the environment on every call.
+    """
+    raw = os.environ.get("TS_CACHE_DIR")
+    return Path(raw) if raw else None
+
+
+def cache_enabled() -> bool:
+    """True only when TS_CACHE_DIR is set and TS_NOCACHE is not truthy."""
+    if cache_dir() is None:
+        return False
+    return os.environ.get("TS_NOCACHE", "").lower() not in ("1", "true", "yes")
+
+
+def _to_json(value):
+    """json.dumps fallback for NumPy scalars and arrays."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _cacheable(value) -> bool:
+    """Only successful results are stored: no None, empty results or error dicts."""
+    if not value:
+        return False
+    return not (isinstance(value, dict) and "error" in value)
+
+
+def cached(ttl: float):
+    """Cache a function's JSON-serializable result on disk for ttl seconds.
+
+    Calls straight through unless the disk cache is enabled (see cache_enabled). Entries
+    are keyed by an MD5 of the function name and its bound arguments. Failed or empty
+    results are never stored, and any I/O problem falls back to calling through.
+
+    Only use it on functions returning JSON-native values (str, numbers, bools, None,
+    lists and str-keyed dicts): a hit returns the JSON round-trip, so tuples would come
+    back as lists and non-str dict keys as strings.
+    """
+
+    def decorator(fn):
+        name = f"{fn.__module__}.{fn.__qualname__}"
+        sig = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if ttl <= 0 or not cache_enabled():
+                return fn(*args, **kwargs)
+
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            raw = json.dumps([name, bound.arguments], sort_keys=True, default=str)
+            path = cache_dir() / name / f"{hashlib.md5(raw.encode()).hexdigest()}.json"
+            try:
+                entry = json.loads(path.read_text())
+                if time.time() - entry["ts"] < ttl:
+                    return entry["value"]
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+
+            value = fn(*args, **kwargs)
+            if _cacheable(value):
+                try:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+                    tmp.write_text(
+                        json.dumps({"ts": time.time(), "value": value}, default=_to_json)
+                    )
+                    os.replace(tmp, path)
+                except (OSError, TypeError, ValueError):
+                    pass
+            return value
+
+        return wrapper
+
+    return decorator
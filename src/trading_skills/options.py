@@ -9,9 +9,9 @@ import yfinance as yf
 from trading_skills.utils import get_current_price
 
 
-def get_expiries(symbol: str) -> list[str]:
-    """Get available option expiration dates."""
-    ticker = yf.Ticker(symbol)
+def get_expiries(symbol: str, ticker: yf.Ticker | None = None) -> list[str]:
+    """Get available option expiration dates, reusing ``ticker`` when given."""
+    ticker = ticker or yf.Ticker(symbol)
     try:
         return list(ticker.options)
     except Exception:
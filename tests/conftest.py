@@ -1,8 +1,13 @@
 # ABOUTME: Shared pytest configuration and fixtures.
-# ABOUTME: Loads .env before test collection so skip markers see env vars.
+# ABOUTME: Loads .env before test collection and disables the on-disk data cache.
+
+import os
 
 from dotenv import load_dotenv
 
 # Load .env early so pytest.mark.skipif conditions on env vars (e.g. MASSIVE_API_KEY)
 # are evaluated with the correct values at collection time.
 load_dotenv()
+
+# Tests patch the data sources, so the on-disk market data cache must stay out of the way.
+os.environ["TS_NOCACHE"] = "1"
@@ -3,17 +3,50 @@
 
 import math
 
+import numpy as np
+from scipy.stats import norm
+
 from trading_skills.black_scholes import (
+    _bs_core,
+    _cdf,
     _implied_volatility_bisection,
+    _pdf,
     black_scholes_delta,
+    black_scholes_delta_vec,
     black_scholes_greeks,
     black_scholes_price,
+    black_scholes_price_vec,
     black_scholes_vega,
     estimate_iv,
+    estimate_iv_vec,
     implied_volatility,
 )
 
 
+class TestNormalDistribution:
+    """Fast CDF/PDF must match scipy.stats.norm."""
+
+    GRID = np.linspace(-8.0, 8.0, 1601)
+
+    def test_cdf_matches_scipy(self):
+        ours = np.array([_cdf(x) for x in self.GRID])
+        np.testing.assert_allclose(ours, norm.cdf(self.GRID), rtol=1e-10, atol=1e-300)
+
+    def test_pdf_matches_scipy(self):
+        ours = np.array([_pdf(x) for x in self.GRID])
+        np.testing.assert_allclose(ours, norm.pdf(self.GRID), rtol=1e-12, atol=1e-300)
+
+    def test_price_matches_scipy_reference(self):
+        for S in (50.0, 100.0, 150.0):
+            for sigma in (0.05, 0.3, 1.5):
+                sqrt_T = math.sqrt(0.5)
+                d1 = (math.log(S / 100.0) + (0.05 + 0.5 * sigma**2) * 0.5) / (sigma * sqrt_T)
+                d2 = d1 - sigma * sqrt_T
+                ref = S * norm.cdf(d1) - 100.0 * math.exp(-0.025) * norm.cdf(d2)
+                price = black_scholes_price(S, 100.0, 0.5, 0.05, sigma, "call")
+                assert math.isclose(price, ref, rel_tol=1e-12, abs_tol=1e-12)
+
+
 class TestBlackScholesPrice:
     """Tests for BS option pricing."""
 
@@ -61,6 +94,23 @@ class TestBlackScholesPrice:
         assert black_scholes_price(90, 100, 1.0, 0.05, 0, "put") == 10
 
 
+class TestBlackScholesPriceVec:
+    """Vectorized pricing must agree with the scalar implementation."""
+
+    def test_matches_scalar_on_grid(self):
+        spots = np.array([80.0, 100.0, 120.0])
+        strikes = np.array([90.0, 100.0, 110.0])[:, None]
+        sigmas = np.array([0.2, 0.45, 0.0])
+        for option_type in ("call", "put"):
+            for T in (0.0, 0.1, 1.0):
+                vec = black_scholes_price_vec(spots, strikes, T, 0.05, sigmas, option_type, 0.01)
+                assert vec.shape == (3, 3)
+                for i, K in enumerate(strikes[:, 0]):
+                    for j, (S, sigma) in enumerate(zip(spots, sigmas)):
+                        ref = black_scholes_price(S, K, T, 0.05, sigma, option_type, 0.01)
+                        assert math.isclose(vec[i, j], ref, rel_tol=1e-12, abs_tol=1e-12)
+
+
 class TestBlackScholesDelta:
     """Tests for BS delta."""
 
@@ -95,6 +145,26 @@ class TestBlackScholesDelta:
         assert black_scholes_delta(90, 100, 0, 0.05, 0.2, "call") == 0.0
 
 
+class TestBlackScholesDeltaVec:
+    """Vectorized delta must agree with the scalar implementation."""
+
+    def test_matches_scalar_on_mixed_book(self):
+        spots = np.array([80.0, 100.0, 120.0, 90.0, 110.0])
+        strikes = np.array([100.0, 100.0, 100.0, 100.0, 100.0])
+        sigmas = np.array([0.2, 0.45, 0.3, 0.0, 0.25])
+        is_call = np.array([True, False, True, False, False])
+        for T in (0.0, 0.1, 1.0):
+            vec = black_scholes_delta_vec(spots, strikes, T, 0.05, sigmas, is_call, 0.01)
+            for S, K, sigma, call, got in zip(spots, strikes, sigmas, is_call, vec):
+                option_type = "call" if call else "put"
+                ref = black_scholes_delta(S, K, T, 0.05, sigma, option_type, 0.01)
+                assert math.isclose(got, ref, rel_tol=1e-12, abs_tol=1e-12)
+
+    def test_empty_input(self):
+        empty = np.array([])
+        assert black_scholes_delta_vec(empty, empty, empty, 0.05, 0.2, empty).shape == (0,)
+
+
 class TestBlackScholesVega:
     """Tests for BS vega."""
 
@@ -120,6 +190,19 @@ class TestBlackScholesVega:
 class TestBlackScholesGreeks:
     """Tests for complete greeks calculation."""
 
+    def test_fused_core_matches_standalone_functions(self):
+        for option_type in ("call", "put"):
+            price, delta, _, _, vega, _, _, _ = _bs_core(
+                105, 100, 0.75, 0.04, 0.3, option_type, q=0.01
+            )
+            assert math.isclose(
+                price, black_scholes_price(105, 100, 0.75, 0.04, 0.3, option_type, q=0.01)
+            )
+            assert math.isclose(
+                delta, black_scholes_delta(105, 100, 0.75, 0.04, 0.3, option_type, q=0.01)
+            )
+            assert math.isclose(vega * 100, black_scholes_vega(105, 100, 0.75, 0.04, 0.3, q=0.01))
+
     def test_returns_all_greeks(self):
         result = black_scholes_greeks(100, 100, 1.0, 0.05, 0.2, "call")
         for key in ["price", "delta", "gamma", "theta", "vega", "rho"]:
@@ -183,6 +266,19 @@ class TestImpliedVolatility:
         assert iv is not None
         assert iv > 1.0
 
+    def test_roundtrip_across_moneyness_and_expiry(self):
+        """Halley iteration recovers the price for deep ITM/OTM and short/long expiries."""
+        for S in (50, 90, 100, 110, 200):
+            for T in (0.02, 0.5, 2.0):
+                for sigma in (0.1, 0.6, 2.0):
+                    for option_type in ("call", "put"):
+                        price = black_scholes_price(S, 100, T, 0.05, sigma, option_type)
+                        if price < 1e-3:
+                            continue
+                        iv = implied_volatility(price, S, 100, T, 0.05, option_type)
+                        repriced = black_scholes_price(S, 100, T, 0.05, iv, option_type)
+                        assert abs(repriced - price) < 1e-5
+
 
 class TestBisectionFallback:
     """Tests for bisection fallback IV."""
@@ -264,3 +360,10 @@ class TestEstimateIV:
     def test_deep_otm_put_higher_iv(self):
         iv = estimate_iv(120, 100, 0.5, "put")
         assert iv > 0.35
+
+    def test_vec_matches_scalar(self):
+        spots = np.array([80.0, 95.0, 100.0, 105.0, 120.0] * 2)
+        is_call = np.array([True] * 5 + [False] * 5)
+        vec = estimate_iv_vec(spots, 100.0, is_call)
+        for spot, call, got in zip(spots, is_call, vec):
+            assert got == estimate_iv(spot, 100.0, 0.5, "call" if call else "put")
@@ -1,15 +1,24 @@
 # ABOUTME: Tests for collar strategy module with mocked Yahoo Finance.
 # ABOUTME: Validates volatility, earnings, and collar analysis.
 
+import math
+import threading
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import numpy as np
 import pandas as pd
 import pytest
 
+from trading_skills.black_scholes import black_scholes_price
+from trading_skills.broker import collar
 from trading_skills.broker.collar import (
+    _get_ticker,
     analyze_collar,
+    fetch_collar_market_data,
+    fetch_collar_market_data_async,
+    find_collar_candidates,
     get_call_market_price,
     get_earnings_date,
     get_put_chain,
@@ -19,6 +28,16 @@ from trading_skills.broker.collar import (
 MODULE = "trading_skills.broker.collar"
 
 
+@pytest.fixture(autouse=True)
+def _clear_collar_caches():
+    """Each test patches yf.Ticker, so shared Tickers and chains must not leak between them."""
+    collar._ticker_cache.clear()
+    collar._put_chain_cache.clear()
+    yield
+    collar._ticker_cache.clear()
+    collar._put_chain_cache.clear()
+
+
 class TestGetEarningsDate:
     """Tests for earnings date fetching."""
 
@@ -74,6 +93,22 @@ class TestGetStockVolatility:
         assert result["annual_vol"] > 0
         assert result["vol_class"] in ["LOW", "MODERATE", "HIGH", "VERY HIGH", "EXTREME"]
 
+    @patch(f"{MODULE}.yf.Ticker")
+    def test_matches_annualized_volatility_helper(self, mock_ticker):
+        from trading_skills.utils import annualized_volatility
+
+        np.random.seed(7)
+        close = pd.Series(100 + np.cumsum(np.random.randn(63)))
+        mock_instance = MagicMock()
+        mock_instance.history.return_value = pd.DataFrame({"Close": close})
+        mock_ticker.return_value = mock_instance
+
+        result = get_stock_volatility("AAPL")
+        _, daily_vol, annual_vol = annualized_volatility(close)
+        assert result["daily_vol"] == pytest.approx(daily_vol, rel=1e-12)
+        assert result["annual_vol"] == pytest.approx(annual_vol, rel=1e-12)
+        assert result["current_price"] == close.iloc[-1]
+
     @patch(f"{MODULE}.yf.Ticker")
     def test_insufficient_data(self, mock_ticker):
         mock_instance = MagicMock()
@@ -154,6 +189,30 @@ class TestGetStockVolatility:
         result = get_stock_volatility("AAPL")
         assert "vol_class" in result
 
+    @pytest.mark.parametrize(
+        "annual_vol, expected",
+        [
+            (0.20, "LOW"),
+            (0.30, "MODERATE"),
+            (0.50, "HIGH"),
+            (0.70, "VERY HIGH"),
+            (0.90, "EXTREME"),
+        ],
+    )
+    @patch(f"{MODULE}.yf.Ticker")
+    def test_vol_class_thresholds(self, mock_ticker, annual_vol, expected):
+        # Alternating +a/-a daily returns give a sample std of a * sqrt(n / (n - 1)).
+        n = 60
+        a = annual_vol / math.sqrt(252) / math.sqrt(n / (n - 1))
+        prices = 100 * np.cumprod([1.0] + [1 + a if i % 2 == 0 else 1 - a for i in range(n)])
+        mock_instance = MagicMock()
+        mock_instance.history.return_value = pd.DataFrame({"Close": prices})
+        mock_ticker.return_value = mock_instance
+
+        result = get_stock_volatility("AAPL")
+        assert result["annual_vol"] == pytest.approx(annual_vol)
+        assert result["vol_class"] == expected
+
     @patch(f"{MODULE}.yf.Ticker")
     def test_vol_exception_returns_error(self, mock_ticker):
         mock_instance = MagicMock()
@@ -191,6 +250,36 @@ class TestGetPutChain:
         assert result[0]["mid"] == pytest.approx(1.1)
         assert "iv" in result[0]
 
+    @patch(f"{MODULE}.yf.Ticker")
+    def test_missing_iv_column_defaults(self, mock_ticker):
+        mock_chain = MagicMock()
+        mock_chain.puts = pd.DataFrame(
+            {"strike": [90.0, 95.0], "bid": [1.0, 1.5], "ask": [1.2, 1.9], "openInterest": [7, 0]}
+        )
+        mock_instance = MagicMock()
+        mock_instance.options = ["2025-06-20"]
+        mock_instance.option_chain.return_value = mock_chain
+        mock_ticker.return_value = mock_instance
+
+        result = get_put_chain("AAPL", "2025-06-20")
+        assert result == [
+            {"strike": 90.0, "bid": 1.0, "ask": 1.2, "mid": pytest.approx(1.1), "oi": 7, "iv": 0.4},
+            {"strike": 95.0, "bid": 1.5, "ask": 1.9, "mid": pytest.approx(1.7), "oi": 0, "iv": 0.4},
+        ]
+
+    def test_given_expiries_skip_ticker_options(self):
+        mock_chain = MagicMock()
+        mock_chain.puts = pd.DataFrame(
+            {"strike": [90.0], "bid": [1.0], "ask": [1.2], "openInterest": [100]}
+        )
+        ticker = MagicMock()
+        type(ticker).options = PropertyMock(side_effect=AssertionError("options refetched"))
+        ticker.option_chain.return_value = mock_chain
+
+        result = get_put_chain("AAPL", "2025-06-20", ticker, ["2025-06-20"])
+        assert [p["strike"] for p in result] == [90.0]
+        assert get_put_chain("AAPL", "2025-07-18", ticker, ["2025-06-20"]) == []
+
     @patch(f"{MODULE}.yf.Ticker")
     def test_returns_empty_when_expiry_not_found(self, mock_ticker):
         mock_instance = MagicMock()
@@ -207,6 +296,89 @@ class TestGetPutChain:
         result = get_put_chain("AAPL", "2025-06-20")
         assert result == []
 
+    @patch(f"{MODULE}.yf.Ticker")
+    def test_second_call_hits_cache(self, mock_ticker):
+        mock_chain = MagicMock()
+        mock_chain.puts = pd.DataFrame(
+            {"strike": [90.0], "bid": [1.0], "ask": [1.2], "openInterest": [100]}
+        )
+        mock_instance = MagicMock()
+        mock_instance.options = ["2025-06-20"]
+        mock_instance.option_chain.return_value = mock_chain
+        mock_ticker.return_value = mock_instance
+
+        first = get_put_chain("AAPL", "2025-06-20")
+        second = get_put_chain("AAPL", "2025-06-20")
+        assert first == second
+        mock_ticker.assert_called_once_with("AAPL")
+        mock_instance.option_chain.assert_called_once()
+
+    @patch(f"{MODULE}.yf.Ticker")
+    def test_expired_entry_refetched(self, mock_ticker):
+        mock_chain = MagicMock()
+        mock_chain.puts = pd.DataFrame(
+            {"strike": [90.0], "bid": [1.0], "ask": [1.2], "openInterest": [100]}
+        )
+        mock_instance = MagicMock()
+        mock_instance.options = ["2025-06-20"]
+        mock_instance.option_chain.return_value = mock_chain
+        mock_ticker.return_value = mock_instance
+
+        get_put_chain("AAPL", "2025-06-20")
+        key = ("AAPL", "2025-06-20")
+        stamp, chain = collar._put_chain_cache[key]
+        collar._put_chain_cache[key] = (stamp - collar.PUT_CHAIN_TTL - 1, chain)
+        get_put_chain("AAPL", "2025-06-20")
+        assert mock_instance.option_chain.call_count == 2
+
+    @patch(f"{MODULE}.yf.Ticker")
+    def test_expired_entry_refetched_with_disk_cache_on(self, mock_ticker, tmp_path, monkeypatch):
+        """Quotes are never served from disk; PUT_CHAIN_TTL alone decides freshness."""
+        monkeypatch.setenv("TS_CACHE_DIR", str(tmp_path))
+        monkeypatch.delenv("TS_NOCACHE", raising=False)
+        mock_chain = MagicMock()
+        mock_chain.puts = pd.DataFrame(
+            {"strike": [90.0], "bid": [1.0], "ask": [1.2], "openInterest": [100]}
+        )
+        mock_instance = MagicMock()
+        mock_instance.options = ["2025-06-20"]
+        mock_instance.option_chain.return_value = mock_chain
+        mock_ticker.return_value = mock_instance
+
+        get_put_chain("AAPL", "2025-06-20")
+        collar._put_chain_cache.clear()
+        get_put_chain("AAPL", "2025-06-20")
+        assert mock_instance.option_chain.call_count == 2
+        assert not list(tmp_path.rglob("*.json"))
+
+    @patch(f"{MODULE}.yf.Ticker")
+    def test_empty_result_not_cached(self, mock_ticker):
+        mock_instance = MagicMock()
+        mock_instance.options = ["2025-07-18"]
+        mock_ticker.return_value = mock_instance
+
+        assert get_put_chain("AAPL", "2025-06-20") == []
+        assert ("AAPL", "2025-06-20") not in collar._put_chain_cache
+
+
+class TestGetTicker:
+    """Tests for the shared yf.Ticker cache."""
+
+    @patch(f"{MODULE}.yf.Ticker")
+    def test_reuses_instance_per_symbol(self, mock_ticker):
+        mock_ticker.side_effect = lambda sym: MagicMock(name=sym)
+        assert _get_ticker("AAPL") is _get_ticker("AAPL")
+        assert _get_ticker("MSFT") is not _get_ticker("AAPL")
+        assert mock_ticker.call_count == 2
+
+    @patch(f"{MODULE}.yf.Ticker")
+    def test_rebuilt_after_ttl(self, mock_ticker):
+        mock_ticker.side_effect = lambda sym: MagicMock(name=sym)
+        first = _get_ticker("AAPL")
+        stamp, ticker = collar._ticker_cache["AAPL"]
+        collar._ticker_cache["AAPL"] = (stamp - collar.TICKER_TTL - 1, ticker)
+        assert _get_ticker("AAPL") is not first
+
 
 class TestGetCallMarketPrice:
     """Tests for call option market price fetching."""
@@ -238,6 +410,19 @@ class TestGetCallMarketPrice:
         result = get_call_market_price("AAPL", 150.0, "20260116")
         assert result is not None
 
+    @patch(f"{MODULE}.yf.Ticker")
+    def test_picks_nearest_of_several_expiries(self, mock_ticker):
+        calls_df = pd.DataFrame({"strike": [150.0], "bid": [4.0], "ask": [4.4], "lastPrice": [4.2]})
+        mock_chain = MagicMock()
+        mock_chain.calls = calls_df
+        mock_instance = MagicMock()
+        mock_instance.options = ["2025-12-19", "2026-01-13", "2026-01-23", "2026-02-20"]
+        mock_instance.option_chain.return_value = mock_chain
+        mock_ticker.return_value = mock_instance
+
+        get_call_market_price("AAPL", 150.0, "20260116")
+        mock_instance.option_chain.assert_called_once_with("2026-01-13")
+
     @patch(f"{MODULE}.yf.Ticker")
     def test_expiry_too_far_returns_none(self, mock_ticker):
         mock_instance = MagicMock()
@@ -282,6 +467,27 @@ class TestGetCallMarketPrice:
         result = get_call_market_price("AAPL", 150.0, "20260116")
         assert result is not None
 
+    @patch(f"{MODULE}.yf.Ticker")
+    def test_unsorted_strikes_tie_prefers_lower(self, mock_ticker):
+        calls_df = pd.DataFrame(
+            {
+                "strike": [160.0, 152.0, 148.0],
+                "bid": [1.0, 3.0, 4.0],
+                "ask": [1.4, 3.4, 4.4],
+                "lastPrice": [1.2, 3.2, 4.2],
+            }
+        )
+        mock_chain = MagicMock()
+        mock_chain.calls = calls_df
+        mock_instance = MagicMock()
+        mock_instance.options = ["2026-01-16"]
+        mock_instance.option_chain.return_value = mock_chain
+        mock_ticker.return_value = mock_instance
+
+        assert get_call_market_price("AAPL", 150.0, "20260116") == pytest.approx(4.2)
+        assert get_call_market_price("AAPL", 160.0, "20260116") == pytest.approx(1.2)
+        assert get_call_market_price("AAPL", 170.0, "20260116") is None
+
     @patch(f"{MODULE}.yf.Ticker")
     def test_exception_returns_none(self, mock_ticker):
         mock_ticker.side_effect = Exception("API error")
@@ -451,3 +657,217 @@ class TestAnalyzeCollar:
 
         assert "unprotected_loss_10" in result
         assert result["long_value_now"] > 0
+
+    def test_long_call_fallback_matches_scalar_black_scholes(self):
+        long_expiry = (datetime.now() + timedelta(days=400)).strftime("%Y%m%d")
+        market = {
+            "volatility": {"annual_vol": 0.35},
+            "put_expiries": [],
+            "put_chains": {},
+            "long_call_price": None,
+        }
+
+        result = analyze_collar(
+            symbol="AAPL",
+            current_price=150.0,
+            long_strike=130.0,
+            long_expiry=long_expiry,
+            long_qty=2,
+            long_cost=25.0,
+            short_positions=[],
+            earnings_date=None,
+            market=market,
+        )
+
+        T = (datetime.strptime(long_expiry, "%Y%m%d") - datetime.now()).days / 365
+        now, down_10, down_15, up_10 = (
+            black_scholes_price(150.0 * m, 130.0, T, 0.05, iv, "call")
+            for m, iv in ((1.0, 0.60), (0.90, 0.65), (0.85, 0.70), (1.10, 0.50))
+        )
+        assert result["long_value_now"] == pytest.approx(now, rel=1e-12)
+        assert result["unprotected_loss_10"] == pytest.approx((now - down_10) * 200, rel=1e-12)
+        assert result["unprotected_loss_15"] == pytest.approx((now - down_15) * 200, rel=1e-12)
+        assert result["unprotected_gain_10"] == pytest.approx((up_10 - now) * 200, rel=1e-12)
+
+    @patch(f"{MODULE}.yf.Ticker")
+    @patch(f"{MODULE}.get_call_market_price")
+    @patch(f"{MODULE}.get_put_chain")
+    @patch(f"{MODULE}.get_expiries")
+    @patch(f"{MODULE}.get_stock_volatility")
+    def test_put_chain_fetched_once_per_expiry(
+        self, mock_vol, mock_expiries, mock_puts, mock_call_price, mock_ticker
+    ):
+        mock_vol.return_value = {"annual_vol": 0.35}
+        expiries = [(datetime.now() + timedelta(days=d)).strftime("%Y-%m-%d") for d in (14, 28)]
+        mock_expiries.return_value = expiries
+        mock_puts.return_value = [{"strike": 140.0, "mid": 2.0}]
+        mock_call_price.return_value = 25.0
+
+        result = analyze_collar(
+            symbol="AAPL",
+            current_price=150.0,
+            long_strike=130.0,
+            long_expiry="20260121",
+            long_qty=1,
+            long_cost=25.0,
+            short_positions=[],
+            earnings_date=None,
+        )
+
+        # Three strikes per expiry, but one chain download per expiry.
+        assert len(result["put_analysis"]) == 6
+        # Rows come grouped by expiry, in expiry order
+        assert [pa["expiry"] for pa in result["put_analysis"]] == [
+            e for e in expiries for _ in range(3)
+        ]
+        assert mock_puts.call_count == 2
+        shared = mock_ticker.return_value
+        assert all(c.args[2] is shared for c in mock_puts.call_args_list)
+        assert mock_call_price.call_args.args[3] is shared
+        mock_ticker.assert_called_once_with("AAPL")
+
+    @patch(f"{MODULE}.yf.Ticker")
+    @patch(f"{MODULE}.get_call_market_price", return_value=25.0)
+    @patch(f"{MODULE}.get_put_chain")
+    @patch(f"{MODULE}.get_expiries")
+    @patch(f"{MODULE}.get_stock_volatility", return_value={"annual_vol": 0.35})
+    def test_chain_strike_float_noise_still_matches(
+        self, mock_vol, mock_expiries, mock_puts, mock_call_price, mock_ticker
+    ):
+        mock_expiries.return_value = [(datetime.now() + timedelta(days=14)).strftime("%Y-%m-%d")]
+        mock_puts.return_value = [{"strike": 140.0000000001, "mid": 2.0}]
+
+        result = analyze_collar(
+            symbol="AAPL",
+            current_price=150.0,
+            long_strike=130.0,
+            long_expiry="20260121",
+            long_qty=1,
+            long_cost=25.0,
+            short_positions=[],
+            earnings_date=None,
+        )
+
+        by_strike = {pa["strike"]: pa for pa in result["put_analysis"]}
+        assert by_strike[140]["cost_per_contract"] == 2.0
+
+
+class TestFetchCollarMarketDataAsync:
+    """Async market-data fetch gathers the same inputs analyze_collar uses."""
+
+    @pytest.mark.asyncio
+    @patch(f"{MODULE}.yf.Ticker")
+    @patch(f"{MODULE}.get_call_market_price", return_value=12.5)
+    @patch(f"{MODULE}.get_put_chain")
+    @patch(f"{MODULE}.get_expiries")
+    @patch(f"{MODULE}.get_stock_volatility", return_value={"annual_vol": 0.3})
+    @patch(f"{MODULE}.get_earnings_date")
+    async def test_gathers_inputs_and_chains(
+        self, mock_earnings, mock_vol, mock_expiries, mock_puts, mock_call_price, mock_ticker
+    ):
+        earnings = datetime.now() + timedelta(days=10)
+        mock_earnings.return_value = (earnings, "after market close")
+        expiries = [(datetime.now() + timedelta(days=d)).strftime("%Y-%m-%d") for d in (17, 31)]
+        mock_expiries.return_value = expiries
+        mock_puts.side_effect = lambda symbol, expiry, ticker, available: [
+            {"strike": 90.0, "mid": 1.0}
+        ]
+
+        market = await fetch_collar_market_data_async("AAPL", 80.0, "20270115")
+
+        assert market["earnings_date"] == earnings
+        assert market["volatility"] == {"annual_vol": 0.3}
+        assert market["long_call_price"] == 12.5
+        assert [pe["expiry"] for pe in market["put_expiries"]] == expiries
+        assert set(market["put_chains"]) == set(expiries)
+        assert mock_puts.call_count == 2
+        # The expiry list is fetched once on the shared Ticker and handed to every lookup
+        mock_expiries.assert_called_once_with("AAPL", mock_ticker.return_value)
+        assert all(c.args[3] is expiries for c in mock_puts.call_args_list)
+        assert mock_call_price.call_args.args[4] is expiries
+
+
+class TestFetchCollarMarketData:
+    """Sync market-data fetch overlaps volatility and quotes with the chain downloads."""
+
+    @patch(f"{MODULE}.yf.Ticker")
+    @patch(f"{MODULE}.get_call_market_price", return_value=12.5)
+    @patch(f"{MODULE}.get_put_chain")
+    @patch(f"{MODULE}.get_expiries")
+    @patch(f"{MODULE}.get_stock_volatility")
+    def test_volatility_overlaps_put_chains(
+        self, mock_vol, mock_expiries, mock_puts, mock_call_price, mock_ticker
+    ):
+        chains_started = threading.Event()
+
+        def slow_volatility(symbol):
+            # Only returns if a put chain fetch starts while this call is in flight.
+            assert chains_started.wait(timeout=5)
+            return {"annual_vol": 0.3}
+
+        def puts(symbol, expiry, ticker, available):
+            chains_started.set()
+            return [{"strike": 90.0, "mid": 1.0}]
+
+        mock_vol.side_effect = slow_volatility
+        mock_puts.side_effect = puts
+        expiries = [(datetime.now() + timedelta(days=d)).strftime("%Y-%m-%d") for d in (17, 31)]
+        mock_expiries.return_value = expiries
+
+        market = fetch_collar_market_data("AAPL", 80.0, "20270115", None)
+
+        assert market["volatility"] == {"annual_vol": 0.3}
+        assert market["long_call_price"] == 12.5
+        assert [pe["expiry"] for pe in market["put_expiries"]] == expiries
+        assert market["put_chains"] == {exp: [{"strike": 90.0, "mid": 1.0}] for exp in expiries}
+
+
+class TestFindCollarCandidates:
+    """The yfinance price fallback must not block the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_fast_info_lookups_run_off_the_loop(self):
+        loop_thread = threading.get_ident()
+        lookup_threads = []
+
+        class LazyFastInfo:
+            def get(self, key):
+                lookup_threads.append(threading.get_ident())
+                return 150.0 if key == "lastPrice" else None
+
+        ib = MagicMock()
+        ib.managedAccounts.return_value = ["U1"]
+
+        @asynccontextmanager
+        async def ctx(*args, **kwargs):
+            yield ib
+
+        long_call = {
+            "account": "U1",
+            "symbol": "AAPL",
+            "sec_type": "OPT",
+            "quantity": 1,
+            "avg_cost": 20.0,
+            "strike": 120.0,
+            "expiry": "20270115",
+            "right": "C",
+        }
+        ticker = MagicMock()
+        ticker.fast_info = LazyFastInfo()
+        with (
+            patch(f"{MODULE}.ib_connection", ctx),
+            patch(f"{MODULE}.fetch_positions", new=AsyncMock(return_value=[])),
+            patch(f"{MODULE}.normalize_positions", return_value=[long_call]),
+            patch(f"{MODULE}.fetch_spot_prices", new=AsyncMock(return_value={})),
+            patch(f"{MODULE}._get_ticker", return_value=ticker),
+            patch(
+                f"{MODULE}.fetch_collar_market_data_async",
+                new=AsyncMock(return_value={"earnings_date": None}),
+            ),
+            patch(f"{MODULE}.analyze_collar", return_value={"ok": True}) as mock_analyze,
+        ):
+            result = await find_collar_candidates("aapl", port=7497)
+
+        assert result == {"ok": True}
+        assert mock_analyze.call_args.kwargs["current_price"] == 150.0
+        assert lookup_threads and loop_thread not in lookup_threads
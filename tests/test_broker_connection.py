@@ -8,11 +8,13 @@ import pytest
 
 from trading_skills.broker.connection import (
     CLIENT_IDS,
+    QUOTE_BATCH_LINES,
     default_ib_port,
     fetch_positions,
     fetch_spot_prices,
     ib_connection,
     normalize_positions,
+    req_tickers_batched,
 )
 
 MODULE = "trading_skills.broker.connection"
@@ -142,6 +144,35 @@ class TestFetchPositions:
         result = asyncio.run(run())
         assert result == [pos1]
 
+    def test_waits_for_position_end_instead_of_sleeping(self):
+        mock_ib = MagicMock()
+        mock_ib.reqPositionsAsync = AsyncMock(return_value=[])
+        mock_ib.positions.return_value = []
+
+        async def run():
+            with patch(f"{MODULE}.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+                await fetch_positions(mock_ib)
+            return mock_sleep
+
+        mock_sleep = asyncio.run(run())
+        mock_ib.reqPositionsAsync.assert_awaited_once()
+        mock_sleep.assert_not_awaited()
+
+    def test_timeout_falls_back_to_synced_positions(self):
+        pos1 = MagicMock()
+        mock_ib = MagicMock()
+        mock_ib.positions.return_value = [pos1]
+
+        async def never_ends():
+            await asyncio.Event().wait()
+
+        mock_ib.reqPositionsAsync = never_ends
+
+        async def run():
+            return await fetch_positions(mock_ib, sleep=0.01)
+
+        assert asyncio.run(run()) == [pos1]
+
 
 class TestNormalizePositions:
     """Tests for normalize_positions pure function."""
@@ -263,6 +294,99 @@ class TestFetchSpotPrices:
         assert result == {}
 
 
+class TestReqTickersBatched:
+    """Chain tickers are requested in bounded, concurrently issued chunks."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_and_preserves_order(self):
+        contracts = list(range(QUOTE_BATCH_LINES * 2 + 5))
+        ib = MagicMock()
+        ib.reqTickersAsync = AsyncMock(side_effect=lambda *cs: list(cs))
+        tickers = await req_tickers_batched(ib, contracts)
+        assert tickers == contracts
+        assert ib.reqTickersAsync.await_count == 3
+        assert all(len(c.args) <= QUOTE_BATCH_LINES for c in ib.reqTickersAsync.await_args_list)
+
+    @pytest.mark.asyncio
+    async def test_semaphore_caps_chunks_in_flight(self):
+        in_flight = 0
+        peak = 0
+
+        async def fake_req(*cs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return list(cs)
+
+        ib = MagicMock()
+        ib.reqTickersAsync = fake_req
+        await req_tickers_batched(ib, list(range(QUOTE_BATCH_LINES * 5)), asyncio.Semaphore(2))
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_timed_out_chunk_is_dropped(self):
+        async def fake_req(*cs):
+            if cs[0] == 0:
+                await asyncio.sleep(1)
+            return list(cs)
+
+        ib = MagicMock()
+        ib.reqTickersAsync = fake_req
+        contracts = list(range(QUOTE_BATCH_LINES + 1))
+        tickers = await req_tickers_batched(ib, contracts, timeout=0.05)
+        assert tickers == [QUOTE_BATCH_LINES]
+
+    def test_qualify_pipelines_chunks(self):
+        contracts = list(range(QUOTE_BATCH_LINES * 4))
+        last = QUOTE_BATCH_LINES * 3
+        events = []
+        release_last = asyncio.Event()
+
+        async def qualify(*chunk):
+            events.append(("qualify", chunk[0]))
+            if chunk[0] == last:
+                # The last chunk is slow; earlier chunks must not wait for it
+                await release_last.wait()
+            return list(chunk)
+
+        async def tickers(*qualified):
+            events.append(("tickers", qualified[0]))
+            if qualified[0] == 0:
+                release_last.set()
+            return [f"t{q}" for q in qualified]
+
+        mock_ib = MagicMock()
+        mock_ib.qualifyContractsAsync = qualify
+        mock_ib.reqTickersAsync = tickers
+
+        result = asyncio.run(req_tickers_batched(mock_ib, contracts, qualify=True))
+
+        assert result == [f"t{c}" for c in contracts]
+        assert [e for e in events if e[0] == "qualify"] == [
+            ("qualify", i) for i in range(0, len(contracts), QUOTE_BATCH_LINES)
+        ]
+        assert events.index(("tickers", 0)) < events.index(("tickers", last))
+
+    def test_failed_qualify_chunk_is_dropped(self):
+        async def qualify(*chunk):
+            if chunk[0] == 0:
+                raise RuntimeError("boom")
+            return [None, *chunk[1:]]
+
+        mock_ib = MagicMock()
+        mock_ib.qualifyContractsAsync = qualify
+        mock_ib.reqTickersAsync = AsyncMock(side_effect=lambda *q: list(q))
+
+        contracts = list(range(QUOTE_BATCH_LINES * 2))
+        result = asyncio.run(req_tickers_batched(mock_ib, contracts, qualify=True))
+        assert result == contracts[QUOTE_BATCH_LINES + 1 :]
+
+    def test_empty_contracts(self):
+        assert asyncio.run(req_tickers_batched(MagicMock(), [], qualify=True)) == []
+
+
 class TestClientIds:
     """Tests for CLIENT_IDS registry."""
 
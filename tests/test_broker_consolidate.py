@@ -1,14 +1,28 @@
 # ABOUTME: Tests for trade consolidation module pure logic functions.
-# ABOUTME: Validates position determination, row consolidation, and CSV reading.
+# ABOUTME: Validates position determination, consolidation, CSV reading, and unrealized P&L.
 
+import asyncio
 import csv
 import tempfile
+from contextlib import asynccontextmanager
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import pandas as pd
+import pytest
+
+from trading_skills.broker import consolidate
 from trading_skills.broker.consolidate import (
+    AGG_COLS,
+    GROUP_COLS,
+    KEEP_COLS,
+    consolidate_frame,
     consolidate_rows,
     determine_position,
+    fetch_unrealized_pnl,
     read_csv_files,
+    read_csv_frame,
 )
 
 
@@ -198,6 +212,34 @@ class TestReadCsvFiles:
             assert len(files) == 1
             assert rows[0]["UnderlyingSymbol"] == "AAPL"
 
+    def test_unused_columns_dropped_and_blank_lines_skipped(self):
+        cols = [*GROUP_COLS, *AGG_COLS, "Extra"]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            csv_path = Path(tmpdir) / "trades.csv"
+            values = ["AAPL", "AAPL250321C200", "20250101", "200", "C", "SELL", "O"]
+            values += ["1", "500", "500", "-1.5", "0", "ignored"]
+            csv_path.write_text(",".join(cols) + "\n\n" + ",".join(values) + "\n")
+
+            rows, files = read_csv_files(Path(tmpdir))
+            assert files == [csv_path]
+            assert rows == [dict(zip(GROUP_COLS + AGG_COLS, values[:7] + [1, 500, 500, -1.5, 0]))]
+
+    def test_many_files_read_in_name_order(self):
+        cols = [*GROUP_COLS, *AGG_COLS]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(12):
+                values = [f"SYM{i}", "S", "20250101", "200", "C", "SELL", "O"]
+                values += [str(i), "0", "0", "0", "0"]
+                (Path(tmpdir) / f"t{i}.csv").write_text(
+                    ",".join(cols) + "\n" + ",".join(values) + "\n"
+                )
+            (Path(tmpdir) / "bad.csv").write_text("col1\nval1\n")
+
+            rows, files = read_csv_files(Path(tmpdir))
+            expected = sorted(p for p in Path(tmpdir).glob("*.csv") if p.name != "bad.csv")
+            assert files == expected
+            assert [r["UnderlyingSymbol"] for r in rows] == [f"SYM{p.stem[1:]}" for p in files]
+
     def test_empty_directory(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             rows, files = read_csv_files(Path(tmpdir))
@@ -230,6 +272,21 @@ class TestReadCsvFiles:
 class TestConsolidateRowsEdgeCases:
     """Edge case tests for consolidate_rows."""
 
+    def test_accepts_generator(self):
+        base = {
+            "UnderlyingSymbol": "AAPL",
+            "Symbol": "AAPL250321C200",
+            "TradeDate": "20250101",
+            "Strike": "200",
+            "Put/Call": "C",
+            "Buy/Sell": "SELL",
+            "Open/CloseIndicator": "O",
+        }
+        rows = ({**base, "Quantity": str(i)} for i in range(1, 4))
+        result = consolidate_rows(rows)
+        assert len(result) == 1
+        assert result[0]["Quantity"] == 6.0
+
     def test_bad_numeric_value_skipped(self):
         rows = [
             {
@@ -253,3 +310,266 @@ class TestConsolidateRowsEdgeCases:
         result = consolidate_rows(rows)
         assert len(result) == 1
         assert result[0]["Quantity"] == 0.0
+
+
+class TestConsolidateFrame:
+    """The DataFrame path the report CLI runs: read_csv_frame then consolidate_frame."""
+
+    def _write(self, path, rows):
+        cols = [*GROUP_COLS, *AGG_COLS, *KEEP_COLS, "Extra"]
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(cols)
+            writer.writerows(rows)
+
+    def test_reads_and_consolidates_files(self):
+        base = ["AAPL", "AAPL250321C200", "20250101", "200", "C", "SELL", "O"]
+        rows = [
+            base + ["1", "500.25", "500", "-1.5", "0", "U1", "Call ", "20250321", "x"],
+            base + ["2", "", "250.10", "-0.75", "12.5", "U1", "Other", "20250321", "x"],
+            [" SPY", "SPY250321P500", "20250102", "500", "P", "BUY", "C"]
+            + ["-3", "-90", "-91", "-1", "bad", "U1", "Put", "20250321", "x"],
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._write(Path(tmpdir) / "a.csv", rows[:2])
+            self._write(Path(tmpdir) / "b.csv", rows[2:])
+            (Path(tmpdir) / "empty.csv").write_text("")
+
+            df, files = read_csv_frame(Path(tmpdir))
+
+        assert len(files) == 3
+        result = consolidate_frame(df)
+        assert len(result) == 2
+        assert list(result[0]) == [*GROUP_COLS, *KEEP_COLS, *AGG_COLS, "Position"]
+        assert all(type(r["Quantity"]) is float for r in result)
+        assert result[0]["Quantity"] == 3.0
+        assert result[0]["NetCash"] == 750.10
+        assert result[0]["Description"] == "Call"
+        assert result[0]["Proceeds"] == 500.25
+        assert result[1]["UnderlyingSymbol"] == "SPY"
+        assert result[1]["Position"] == "CLOSE_SHORT"
+        assert result[1]["FifoPnlRealized"] == 0.0
+
+    def test_position_matches_determine_position(self):
+        combos = [("SELL", "O"), ("buy", "o"), ("BUY", "C"), ("sell", "C;P"), ("", "")]
+        df = pd.DataFrame(
+            [
+                {**dict.fromkeys(GROUP_COLS, "X"), "Buy/Sell": bs, "Open/CloseIndicator": oc}
+                for bs, oc in combos
+            ]
+        )
+        result = consolidate_frame(df)
+        assert [r["Position"] for r in result] == [determine_position(*c) for c in combos]
+
+    def test_sort_ties_keep_first_seen_order(self):
+        rows = [
+            {**dict.fromkeys(GROUP_COLS, "X"), "UnderlyingSymbol": sym, "Strike": strike}
+            for sym, strike in [("B", "3"), ("A", "2"), ("B", "1"), ("A", "9"), ("A", "2")]
+        ]
+        result = consolidate_frame(pd.DataFrame(rows))
+        assert [(r["UnderlyingSymbol"], r["Strike"]) for r in result] == [
+            ("A", "2"),
+            ("A", "9"),
+            ("B", "3"),
+            ("B", "1"),
+        ]
+
+    def test_no_rows_returns_none(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self._write(Path(tmpdir) / "a.csv", [])
+            df, files = read_csv_frame(Path(tmpdir))
+        assert df is None
+        assert len(files) == 1
+
+    def test_skips_file_missing_columns(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "bad.csv").write_text("col1,col2\nval1,val2\n")
+            df, files = read_csv_frame(Path(tmpdir))
+        assert df is None
+        assert files == []
+
+
+class TestFetchUnrealizedPnl:
+    """Unrealized P&L from mocked IB option positions and tickers."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_pnl_cache(self):
+        consolidate._pnl_cache.clear()
+        yield
+        consolidate._pnl_cache.clear()
+
+    def _option(self, symbol, strike, qty, avg_cost, multiplier="100"):
+        contract = SimpleNamespace(
+            symbol=symbol,
+            secType="OPT",
+            conId=int(strike),
+            strike=strike,
+            lastTradeDateOrContractMonth="20250321",
+            right="C",
+            multiplier=multiplier,
+        )
+        return SimpleNamespace(account="U1", contract=contract, position=qty, avgCost=avg_cost)
+
+    def _run(self, ib, positions, fetch_tickers):
+        @asynccontextmanager
+        async def ctx(*args, **kwargs):
+            yield ib
+
+        with (
+            patch("trading_skills.broker.consolidate.ib_connection", ctx),
+            patch(
+                "trading_skills.broker.consolidate.fetch_positions",
+                new=AsyncMock(return_value=positions),
+            ),
+            patch("trading_skills.broker.consolidate.req_tickers_batched", new=fetch_tickers),
+        ):
+            return asyncio.run(fetch_unrealized_pnl(port=7497))
+
+    def test_portfolio_pnl_used_and_rest_priced_from_tickers(self):
+        positions = [
+            self._option("AAPL", 200.0, -2, 300.0),
+            self._option("AAPL", 210.0, 1, 100.0),
+            self._option("MSFT", 400.0, 1, 500.0),
+        ]
+        item = SimpleNamespace(
+            account="U1",
+            contract=positions[0].contract,
+            marketPrice=2.0,
+            unrealizedPNL=200.0,
+        )
+        no_price = SimpleNamespace(
+            account="U1",
+            contract=positions[2].contract,
+            marketPrice=-1.0,
+            unrealizedPNL=float("nan"),
+        )
+        ticker = MagicMock()
+        ticker.contract = positions[1].contract
+        ticker.marketPrice.return_value = 1.5
+
+        ib = MagicMock()
+        ib.managedAccounts.return_value = ["U1"]
+        ib.portfolio.return_value = [item, no_price]
+        fetch_tickers = AsyncMock(return_value=[ticker])
+
+        pnl, _ = self._run(ib, positions, fetch_tickers)
+
+        # 200 from the portfolio item, (1.5 - 1.0) * 100 from the ticker
+        assert pnl == {"AAPL": 250.0}
+        assert fetch_tickers.await_args.args[1] == [p.contract for p in positions[1:]]
+
+    def test_no_ticker_request_when_portfolio_covers_all(self):
+        positions = [self._option("AAPL", 200.0, -2, 300.0)]
+        item = SimpleNamespace(
+            account="U1", contract=positions[0].contract, marketPrice=2.0, unrealizedPNL=200.0
+        )
+        ib = MagicMock()
+        ib.managedAccounts.return_value = ["U1"]
+        ib.portfolio.return_value = [item]
+        fetch_tickers = AsyncMock(return_value=[])
+
+        pnl, _ = self._run(ib, positions, fetch_tickers)
+
+        assert pnl == {"AAPL": 200.0}
+        fetch_tickers.assert_not_awaited()
+
+    def test_sums_option_pnl_by_underlying(self):
+        positions = [
+            self._option("AAPL", 200.0, -2, 300.0),
+            self._option("AAPL", 210.0, 1, 100.0),
+            self._option("MSFT", 400.0, 1, 500.0),  # no quote: skipped
+            SimpleNamespace(
+                account="U1", contract=SimpleNamespace(symbol="AAPL", secType="STK"), position=100
+            ),
+        ]
+        quotes = {200.0: 2.0, 210.0: 1.5}
+        tickers = []
+        for pos in positions[:2]:
+            ticker = MagicMock()
+            ticker.contract = pos.contract
+            ticker.marketPrice.return_value = quotes[pos.contract.strike]
+            tickers.append(ticker)
+
+        ib = MagicMock()
+        ib.managedAccounts.return_value = ["U1"]
+        ib.portfolio.return_value = []
+        fetch_tickers = AsyncMock(return_value=tickers)
+
+        pnl, account = self._run(ib, positions, fetch_tickers)
+
+        assert account == "U1"
+        # (2.0 - 3.0) * -2 * 100 + (1.5 - 1.0) * 1 * 100
+        assert pnl == {"AAPL": 250.0}
+        assert fetch_tickers.await_args.args[1] == [p.contract for p in positions[:3]]
+
+    def test_falls_back_to_next_port_and_disconnects_on_error(self):
+        ib = MagicMock()
+        ib.managedAccounts.return_value = ["U1"]
+        events = []
+
+        @asynccontextmanager
+        async def ctx(port, client_id):
+            if port == 7496:
+                raise ConnectionError("refused")
+            events.append(("connect", port))
+            try:
+                yield ib
+            finally:
+                events.append(("disconnect", port))
+
+        with (
+            patch("trading_skills.broker.consolidate.ib_connection", ctx),
+            patch(
+                "trading_skills.broker.consolidate.fetch_positions",
+                new=AsyncMock(side_effect=RuntimeError("lost")),
+            ),
+        ):
+            with pytest.raises(RuntimeError):
+                asyncio.run(fetch_unrealized_pnl())
+
+        assert events == [("connect", 7497), ("disconnect", 7497)]
+
+    def test_skipped_without_ib_async(self):
+        with patch("trading_skills.broker.consolidate._IB_AVAILABLE", False):
+            assert asyncio.run(fetch_unrealized_pnl(port=7497)) == ({}, None)
+
+    def test_recent_result_reused_in_process(self):
+        positions = [self._option("AAPL", 200.0, -2, 300.0)]
+        item = SimpleNamespace(
+            account="U1", contract=positions[0].contract, marketPrice=2.0, unrealizedPNL=200.0
+        )
+        ib = MagicMock()
+        ib.managedAccounts.return_value = ["U1"]
+        ib.portfolio.return_value = [item]
+        connects = []
+
+        @asynccontextmanager
+        async def ctx(port, client_id):
+            connects.append(port)
+            yield ib
+
+        with (
+            patch("trading_skills.broker.consolidate.ib_connection", ctx),
+            patch(
+                "trading_skills.broker.consolidate.fetch_positions",
+                new=AsyncMock(return_value=positions),
+            ),
+        ):
+            first = asyncio.run(fetch_unrealized_pnl(port=7497))
+            second = asyncio.run(fetch_unrealized_pnl(port=7497))
+            assert connects == [7497]
+            assert asyncio.run(fetch_unrealized_pnl(port=7497, cache_ttl=0)) == first
+            assert connects == [7497, 7497]
+
+        assert first == second == ({"AAPL": 200.0}, "U1")
+
+    def test_failed_connection_not_cached(self):
+        @asynccontextmanager
+        async def ctx(port, client_id):
+            raise ConnectionError("refused")
+            yield
+
+        with patch("trading_skills.broker.consolidate.ib_connection", ctx):
+            assert asyncio.run(fetch_unrealized_pnl(port=7497)) == ({}, None)
+
+        assert 7497 not in consolidate._pnl_cache
@@ -0,0 +1,148 @@
+# ABOUTME: Tests for delta-adjusted notional exposure with a mocked IB connection.
+# ABOUTME: Validates vectorized option deltas and the account/underlying summaries.
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import date, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from trading_skills.black_scholes import black_scholes_delta, estimate_iv
+from trading_skills.broker.connection import MAX_CONCURRENT_QUOTE_BATCHES, QUOTE_BATCH_LINES
+from trading_skills.broker.delta_exposure import get_delta_exposure
+
+MODULE = "trading_skills.broker.delta_exposure"
+
+
+def _option(account, symbol, strike, right, qty, sec_type="OPT", multiplier="100", days=90):
+    expiry = (date.today() + timedelta(days=days)).strftime("%Y%m%d")
+    contract = SimpleNamespace(
+        symbol=symbol,
+        secType=sec_type,
+        strike=strike,
+        lastTradeDateOrContractMonth=expiry,
+        right=right,
+        multiplier=multiplier,
+    )
+    return SimpleNamespace(account=account, contract=contract, position=qty, avgCost=1.0)
+
+
+def _stock(account, symbol, qty, avg_cost):
+    contract = SimpleNamespace(symbol=symbol, secType="STK", multiplier="")
+    return SimpleNamespace(account=account, contract=contract, position=qty, avgCost=avg_cost)
+
+
+def _run(positions, spot_prices):
+    ib = MagicMock()
+    ib.managedAccounts.return_value = ["U1", "U2"]
+
+    @asynccontextmanager
+    async def ctx(*args, **kwargs):
+        yield ib
+
+    def ticker(contract):
+        t = MagicMock()
+        t.contract.symbol = contract.symbol
+        t.marketPrice.return_value = spot_prices.get(contract.symbol, float("nan"))
+        return t
+
+    async def qualify(*contracts):
+        return list(contracts)
+
+    async def tickers(*contracts):
+        return [ticker(c) for c in contracts]
+
+    ib.qualifyContractsAsync = qualify
+    ib.reqTickersAsync = tickers
+    with (
+        patch(f"{MODULE}.ib_connection", ctx),
+        patch(f"{MODULE}.fetch_positions", new=AsyncMock(return_value=positions)),
+    ):
+        return asyncio.run(get_delta_exposure(port=7497))
+
+
+class TestGetDeltaExposure:
+    def test_option_deltas_match_scalar_black_scholes(self):
+        positions = [
+            _option("U1", "AAPL", 180.0, "C", 2),
+            _option("U1", "AAPL", 220.0, "P", -1),
+            _option("U2", "MSFT", 300.0, "C", 1),  # no quote: spot falls back to 95% of strike
+            _option("U1", "NQ", 21000.0, "P", 1, sec_type="FOP", multiplier="20"),
+        ]
+        result = _run(positions, {"AAPL": 200.0})
+
+        for pos, row in zip(positions, result["positions"]):
+            c = pos.contract
+            option_type = "call" if c.right == "C" else "put"
+            years = 90 / 365.0
+            if c.secType == "FOP":
+                spot, iv = 21500, 0.20
+            else:
+                spot = 200.0 if c.symbol == "AAPL" else c.strike * 0.95
+                iv = estimate_iv(spot, c.strike, years, option_type)
+            delta = black_scholes_delta(spot, c.strike, years, 0.05, iv, option_type)
+            assert row["delta"] == round(delta, 4)
+            expected = round(delta * spot * pos.position * int(c.multiplier), 2)
+            assert row["delta_notional"] == expected
+
+    def test_summaries_split_long_and_short(self):
+        # Without option positions no spots are requested, so stocks use avg cost
+        positions = [
+            _stock("U1", "AAPL", 100, 150.0),
+            _stock("U2", "AAPL", -20, 150.0),
+            _stock("U2", "ZERO", 0, 10.0),
+        ]
+        result = _run(positions, {})
+        summary = result["summary"]
+
+        assert summary["total_long_delta_notional"] == 15000.0
+        assert summary["total_short_delta_notional"] == -3000.0
+        assert summary["net_delta_notional"] == 12000.0
+        assert summary["by_account"] == {
+            "U1": {"long": 15000.0, "short": 0},
+            "U2": {"long": 0, "short": -3000.0},
+        }
+        assert summary["by_underlying"] == {
+            "AAPL": {"long": 15000.0, "short": -3000.0, "net": 12000.0},
+            "ZERO": {"long": 0, "short": 0.0, "net": 0.0},
+        }
+
+    def test_spot_batches_overlap_without_sleeps(self):
+        symbols = [f"S{i:02d}" for i in range(45)]
+        positions = [_option("U1", sym, 100.0, "C", 1) for sym in symbols]
+        ib = MagicMock()
+        ib.managedAccounts.return_value = ["U1"]
+        in_flight = []
+        batch_sizes = []
+
+        @asynccontextmanager
+        async def ctx(*args, **kwargs):
+            yield ib
+
+        async def qualify(*contracts):
+            return list(contracts)
+
+        async def tickers(*contracts):
+            in_flight.append(1)
+            batch_sizes.append((len(contracts), len(in_flight)))
+            await asyncio.sleep(0)
+            in_flight.pop()
+            out = []
+            for c in contracts:
+                t = MagicMock()
+                t.contract.symbol = c.symbol
+                t.marketPrice.return_value = 100.0
+                out.append(t)
+            return out
+
+        ib.qualifyContractsAsync = qualify
+        ib.reqTickersAsync = tickers
+        with (
+            patch(f"{MODULE}.ib_connection", ctx),
+            patch(f"{MODULE}.fetch_positions", new=AsyncMock(return_value=positions)),
+        ):
+            result = asyncio.run(get_delta_exposure(port=7497))
+
+        assert sorted(size for size, _ in batch_sizes) == [15, QUOTE_BATCH_LINES]
+        assert max(active for _, active in batch_sizes) == MAX_CONCURRENT_QUOTE_BATCHES
+        assert all(row["spot"] == 100.0 for row in result["positions"])
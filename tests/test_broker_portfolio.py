@@ -26,6 +26,7 @@ class TestGetPortfolio:
         with patch("trading_skills.broker.connection.IB") as MockIB:
             mock_ib = MagicMock()
             mock_ib.connectAsync = AsyncMock()
+            mock_ib.reqPositionsAsync = AsyncMock()
             mock_ib.managedAccounts.return_value = ["U123456"]
             mock_ib.disconnect = MagicMock()
             MockIB.return_value = mock_ib
@@ -39,6 +40,7 @@ class TestGetPortfolio:
         with patch("trading_skills.broker.connection.IB") as MockIB:
             mock_ib = MagicMock()
             mock_ib.connectAsync = AsyncMock()
+            mock_ib.reqPositionsAsync = AsyncMock()
             mock_ib.managedAccounts.return_value = ["U123456"]
             mock_ib.positions.return_value = []
             mock_ib.disconnect = MagicMock()
@@ -54,6 +56,7 @@ class TestGetPortfolio:
         with patch("trading_skills.broker.connection.IB") as MockIB:
             mock_ib = MagicMock()
             mock_ib.connectAsync = AsyncMock()
+            mock_ib.reqPositionsAsync = AsyncMock()
             mock_ib.managedAccounts.return_value = ["U123456"]
             mock_ib.disconnect = MagicMock()
 
@@ -80,6 +83,7 @@ class TestGetPortfolio:
         with patch("trading_skills.broker.connection.IB") as MockIB:
             mock_ib = MagicMock()
             mock_ib.connectAsync = AsyncMock()
+            mock_ib.reqPositionsAsync = AsyncMock()
             mock_ib.managedAccounts.return_value = ["U123456", "U789012"]
             mock_ib.positions.return_value = []
             mock_ib.disconnect = MagicMock()
@@ -89,6 +93,31 @@ class TestGetPortfolio:
             assert result["connected"] is True
             assert result["accounts"] == ["U123456", "U789012"]
 
+    def test_accounts_share_one_positions_request(self):
+        """Positions for several accounts come from a single request, filtered locally."""
+        with patch("trading_skills.broker.connection.IB") as MockIB:
+            mock_ib = MagicMock()
+            mock_ib.connectAsync = AsyncMock()
+            mock_ib.reqPositionsAsync = AsyncMock()
+            mock_ib.managedAccounts.return_value = ["U123456", "U789012"]
+            mock_ib.disconnect = MagicMock()
+            positions = []
+            for acct in ("U123456", "U789012", "U000000"):
+                pos = MagicMock()
+                pos.account = acct
+                pos.contract.symbol = "AAPL"
+                pos.contract.secType = "STK"
+                pos.contract.currency = "USD"
+                pos.position = 10
+                pos.avgCost = 150.0
+                positions.append(pos)
+            mock_ib.positions.return_value = positions
+            MockIB.return_value = mock_ib
+
+            result = asyncio.run(get_portfolio(port=7497, all_accounts=True))
+            assert mock_ib.reqPositionsAsync.await_count == 1
+            assert [p["account"] for p in result["positions"]] == ["U123456", "U789012"]
+
     def test_option_position(self):
         """Formats option position with underlying price."""
         with (
@@ -99,6 +128,7 @@ class TestGetPortfolio:
         ):
             mock_ib = MagicMock()
             mock_ib.connectAsync = AsyncMock()
+            mock_ib.reqPositionsAsync = AsyncMock()
             mock_ib.managedAccounts.return_value = ["U123456"]
             mock_ib.disconnect = MagicMock()
             mock_ib.cancelMktData = MagicMock()
@@ -147,3 +177,52 @@ class TestGetPortfolio:
             assert opt["strike"] == 200.0
             assert opt["right"] == "C"
             assert opt["quantity"] == -5
+
+    def test_option_tickers_overlap_spot_prices(self):
+        """Option tickers are requested while spot prices are still streaming."""
+        events = []
+
+        async def slow_spot(ib, symbols):
+            events.append("spot-start")
+            await asyncio.sleep(0.01)
+            events.append("spot-done")
+            return {"AAPL": 195.0}
+
+        async def fetch(coro, timeout, default):
+            events.append("options")
+            return await coro
+
+        with (
+            patch("trading_skills.broker.connection.IB") as MockIB,
+            patch("trading_skills.broker.portfolio.fetch_spot_prices", side_effect=slow_spot),
+            patch("trading_skills.broker.portfolio.fetch_with_timeout", side_effect=fetch),
+        ):
+            mock_ib = MagicMock()
+            mock_ib.connectAsync = AsyncMock()
+            mock_ib.reqPositionsAsync = AsyncMock()
+            mock_ib.managedAccounts.return_value = ["U123456"]
+
+            pos = MagicMock()
+            pos.account = "U123456"
+            pos.contract.symbol = "AAPL"
+            pos.contract.secType = "OPT"
+            pos.contract.strike = 200.0
+            pos.contract.lastTradeDateOrContractMonth = "20250321"
+            pos.contract.right = "C"
+            pos.contract.multiplier = "100"
+            pos.position = -5
+            pos.avgCost = 250.0
+            mock_ib.positions.return_value = [pos]
+
+            opt_ticker = MagicMock()
+            opt_ticker.contract = pos.contract
+            opt_ticker.marketPrice.return_value = 3.50
+            mock_ib.qualifyContractsAsync = AsyncMock(return_value=[pos.contract])
+            mock_ib.reqTickersAsync = AsyncMock(return_value=[opt_ticker])
+            MockIB.return_value = mock_ib
+
+            result = asyncio.run(get_portfolio(port=7497))
+            assert events.index("options") < events.index("spot-done")
+            opt = result["positions"][0]
+            assert opt["underlying_price"] == 195.0
+            assert opt["market_price"] == 3.5
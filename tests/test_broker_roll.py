@@ -1,11 +1,14 @@
 # ABOUTME: Tests for roll analysis module pure logic functions.
 # ABOUTME: Validates candidate evaluation and roll calculation logic.
 
+import asyncio
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from trading_skills.broker import roll
 from trading_skills.broker.roll import (
     _bs_delta,
     _bs_iv,
@@ -14,11 +17,13 @@ from trading_skills.broker.roll import (
     _estimate_iv,
     _get_stalled_price,
     _norm_cdf,
+    _quotes_by_expiry,
     _select_roll_strikes,
     calculate_roll_options,
     evaluate_short_candidates,
     get_current_position,
     get_long_option_position,
+    get_option_chain_params,
     get_underlying_price,
 )
 from trading_skills.utils import days_to_expiry
@@ -349,6 +354,14 @@ class TestSelectRollStrikes:
         )
         assert any(s > 100.0 for s in strikes)
 
+    def test_unsorted_chain_returns_sorted_floats(self):
+        strikes = _select_roll_strikes([120, 95, 110.0, 100, 200], 100.0, "C", half_band=20.0)
+        assert strikes == [100.0, 110.0, 120.0]
+        assert all(type(s) is float for s in strikes)
+
+    def test_empty_chain(self):
+        assert _select_roll_strikes([], 100.0, "C", half_band=20.0) == []
+
 
 class TestBestPrice:
     """_best_price prefers live marketPrice, falls back to IB close."""
@@ -703,3 +716,115 @@ class TestDataDelayLabel:
     def test_stalled_when_price_stale_even_during_live(self):
         result = self._make_roll_result(price_stale=True, is_live=True)
         assert result == "stalled - using last known price"
+
+
+class TestGetOptionChainParamsCache:
+    """get_option_chain_params reuses IB chain metadata within a session."""
+
+    def _make_ib(self, expirations):
+        ib = MagicMock()
+        chain = MagicMock()
+        chain.exchange = "SMART"
+        chain.expirations = expirations
+        chain.strikes = [100.0, 105.0]
+        ib.qualifyContractsAsync = AsyncMock(return_value=[])
+        ib.reqSecDefOptParamsAsync = AsyncMock(return_value=[chain])
+        return ib
+
+    @pytest.mark.asyncio
+    async def test_second_call_hits_cache(self):
+        roll._chain_params_cache.clear()
+        ib = self._make_ib(["20260320", "20260116"])
+        first = await get_option_chain_params(ib, "AAPL")
+        second = await get_option_chain_params(ib, "AAPL")
+        assert first == second
+        assert first["expirations"] == ["20260116", "20260320"]
+        assert ib.reqSecDefOptParamsAsync.await_count == 1
+        roll._chain_params_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_empty_result_not_cached(self):
+        roll._chain_params_cache.clear()
+        ib = self._make_ib([])
+        await get_option_chain_params(ib, "AAPL")
+        await get_option_chain_params(ib, "AAPL")
+        assert ib.reqSecDefOptParamsAsync.await_count == 2
+        roll._chain_params_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_refetched(self):
+        roll._chain_params_cache.clear()
+        ib = self._make_ib(["20260116"])
+        await get_option_chain_params(ib, "AAPL")
+        key = next(iter(roll._chain_params_cache))
+        stamp, params = roll._chain_params_cache[key]
+        roll._chain_params_cache[key] = (stamp - roll.CHAIN_PARAMS_TTL - 1, params)
+        await get_option_chain_params(ib, "AAPL")
+        assert ib.reqSecDefOptParamsAsync.await_count == 2
+        roll._chain_params_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_ports_do_not_share_entries(self):
+        roll._chain_params_cache.clear()
+        ib = self._make_ib(["20260116"])
+        await get_option_chain_params(ib, "AAPL", port=7496)
+        await get_option_chain_params(ib, "AAPL", port=7497)
+        await get_option_chain_params(ib, "AAPL", port=7497)
+        assert ib.reqSecDefOptParamsAsync.await_count == 2
+        roll._chain_params_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_caller_mutation_does_not_leak_into_cache(self):
+        roll._chain_params_cache.clear()
+        ib = self._make_ib(["20260320", "20260116"])
+        first = await get_option_chain_params(ib, "AAPL")
+        first["expirations"].append("20991231")
+        second = await get_option_chain_params(ib, "AAPL")
+        second["strikes"].clear()
+        third = await get_option_chain_params(ib, "AAPL")
+        assert third == {"expirations": ["20260116", "20260320"], "strikes": [100.0, 105.0]}
+        assert ib.reqSecDefOptParamsAsync.await_count == 1
+        roll._chain_params_cache.clear()
+
+
+class TestQuotesByExpiry:
+    """Per-expiry quote fetches run concurrently under a shared line budget."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetch_is_bounded_and_keyed_by_expiry(self):
+        expiries = ["20260116", "20260220", "20260320", "20260417"]
+        in_flight = 0
+        peak = 0
+
+        async def qualify(*contracts):
+            return list(contracts)
+
+        async def req_tickers(*contracts):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [
+                SimpleNamespace(
+                    contract=c,
+                    bid=1.0,
+                    ask=1.2,
+                    last=1.1,
+                    close=1.0,
+                    modelGreeks=None,
+                    bidGreeks=None,
+                    lastGreeks=None,
+                )
+                for c in contracts
+            ]
+
+        ib = MagicMock()
+        ib.qualifyContractsAsync = AsyncMock(side_effect=qualify)
+        ib.reqTickersAsync = AsyncMock(side_effect=req_tickers)
+
+        result = await _quotes_by_expiry(ib, "AAPL", expiries, [100.0, 105.0], "C", None)
+
+        assert list(result) == expiries
+        assert all(len(quotes) == 2 for quotes in result.values())
+        assert peak == 2
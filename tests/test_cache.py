@@ -0,0 +1,104 @@
+# ABOUTME: Tests for the file-backed market data cache.
+# ABOUTME: Covers hits, TTL expiry, skipped failures and the opt-in switches.
+
+import json
+import time
+
+import numpy as np
+import pytest
+
+from trading_skills.cache import cache_dir, cached
+
+
+@pytest.fixture
+def cache_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("TS_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("TS_NOCACHE", raising=False)
+    return tmp_path
+
+
+def _counter(ttl=60, result=None):
+    calls = []
+
+    @cached(ttl)
+    def fetch(symbol, expiry="2026-01-16"):
+        calls.append(symbol)
+        return result if result is not None else {"symbol": symbol, "n": len(calls)}
+
+    return fetch, calls
+
+
+class TestCached:
+    def test_second_call_hits_disk(self, cache_env):
+        fetch, calls = _counter()
+        assert fetch("AAPL") == fetch("AAPL")
+        assert calls == ["AAPL"]
+        assert cache_dir() == cache_env
+        assert list(cache_env.rglob("*.json"))
+
+    def test_positional_and_keyword_share_key(self, cache_env):
+        fetch, calls = _counter()
+        fetch("AAPL", "2026-01-16")
+        fetch("AAPL", expiry="2026-01-16")
+        fetch("AAPL")
+        assert len(calls) == 1
+
+    def test_distinct_args_distinct_entries(self, cache_env):
+        fetch, calls = _counter()
+        fetch("AAPL")
+        fetch("MSFT")
+        fetch("AAPL", "2026-02-20")
+        assert len(calls) == 3
+
+    def test_expired_entry_refetched(self, cache_env):
+        fetch, calls = _counter()
+        fetch("AAPL")
+        (path,) = cache_env.rglob("*.json")
+        entry = json.loads(path.read_text())
+        entry["ts"] = time.time() - 61
+        path.write_text(json.dumps(entry))
+        fetch("AAPL")
+        assert len(calls) == 2
+
+    @pytest.mark.parametrize("result", [[], {"error": "Insufficient data"}])
+    def test_failures_not_cached(self, cache_env, result):
+        fetch, calls = _counter(result=result)
+        fetch("AAPL")
+        fetch("AAPL")
+        assert len(calls) == 2
+        assert not list(cache_env.rglob("*.json"))
+
+    def test_numpy_values_round_trip(self, cache_env):
+        fetch, _ = _counter(result={"oi": np.int64(7), "iv": np.float64(0.3)})
+        fetch("AAPL")
+        assert fetch("AAPL") == {"oi": 7, "iv": 0.3}
+
+    def test_corrupt_entry_ignored(self, cache_env):
+        fetch, calls = _counter()
+        fetch("AAPL")
+        (path,) = cache_env.rglob("*.json")
+        path.write_text("not json")
+        assert fetch("AAPL")["n"] == 2
+
+    def test_nocache_env_bypasses(self, cache_env, monkeypatch):
+        monkeypatch.setenv("TS_NOCACHE", "1")
+        fetch, calls = _counter()
+        fetch("AAPL")
+        fetch("AAPL")
+        assert len(calls) == 2
+        assert not list(cache_env.rglob("*.json"))
+
+    def test_off_without_cache_dir(self, cache_env, monkeypatch):
+        monkeypatch.delenv("TS_CACHE_DIR")
+        fetch, calls = _counter()
+        fetch("AAPL")
+        fetch("AAPL")
+        assert len(calls) == 2
+        assert cache_dir() is None
+        assert not list(cache_env.rglob("*.json"))
+
+    def test_zero_ttl_bypasses(self, cache_env):
+        fetch, calls = _counter(ttl=0)
+        fetch("AAPL")
+        fetch("AAPL")
+        assert len(calls) == 2
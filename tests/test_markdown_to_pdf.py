@@ -226,6 +226,15 @@ class TestSanitize:
         result = _sanitize("café", unicode_font=False)
         assert "caf" in result
 
+    def test_curly_quotes_straightened(self):
+        text = "\u2018it\u2019s\u2019 \u201cquoted\u201d"
+        assert _sanitize(text, unicode_font=True) == "'it's' \"quoted\""
+        assert _sanitize(text, unicode_font=False) == "'it's' \"quoted\""
+
+    def test_plain_punctuation_untouched(self):
+        text = "a: '\"', b"
+        assert _sanitize(text, unicode_font=True) == text
+
 
 class TestBug47Fixes:
     """Tests for issue #47: emoji rendering, table header text color, checkmark handling."""
@@ -238,7 +238,8 @@ class TestIBTools:
 
         ids = ["Q_2024", "Q_2025"]
         with patch(
-            "mcp_server.server.get_trades", new=AsyncMock(return_value={"connected": True})
+            "trading_skills.broker.trades.get_trades",
+            new=AsyncMock(return_value={"connected": True}),
         ) as mock:
             asyncio.run(
                 ib_trades_history(
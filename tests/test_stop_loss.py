@@ -1307,6 +1307,7 @@ class TestGetStopLossData:
         mock_ib = MagicMock()
         mock_ib.managedAccounts.return_value = ["U123"]
         mock_ib.positions.return_value = []
+        mock_ib.reqPositionsAsync = AsyncMock(return_value=[])
         mock_ib.reqAllOpenOrdersAsync = AsyncMock(return_value=[])
         mock_ib.openTrades.return_value = []
         return mock_ib
@@ -1490,6 +1491,7 @@ class TestLegsFilterIntegration:
             self._pos("U123", "IBKR", -30, -3.49, 100.0, "20260918"),  # target short
             self._pos("U123", "IBKR", 10, 5.0, 80.0, "20270618"),  # other LEAPS, must be excluded
         ]
+        mock_ib.reqPositionsAsync = AsyncMock(return_value=[])
         mock_ib.reqAllOpenOrdersAsync = AsyncMock(return_value=[])
         mock_ib.openTrades.return_value = []
 